@@ -32,7 +32,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 # Import our custom modules
-from scripts.drone_simulation import DroneSimulator
+from scripts.drone_simulation import DroneSimulator, save_report
 try:
     from scripts.image_processing import ImageProcessor  # optional, not required for dashboard runtime
 except Exception as _import_err:
@@ -202,11 +202,11 @@ class DashboardDataManager:
             }
         
         stats = {
-            'zones_scanned': len(drone_simulator.scan_data),
+            'zones_scanned': drone_simulator.scan_count,
             'actions_taken': len(drone_simulator.action_history),
             'battery_level': drone_simulator.battery_level,
             'spray_level': drone_simulator.current_spray_level,
-            'flight_time': len(drone_simulator.flight_log),
+            'flight_time': drone_simulator.flight_event_count,
             'success_rate': self._calculate_success_rate()
         }
         
@@ -248,8 +248,8 @@ class DashboardDataManager:
                 })
             
             # Health alerts
-            if drone_simulator.scan_data:
-                recent_scans = drone_simulator.scan_data[-10:]  # Last 10 scans
+            if drone_simulator.scan_count:
+                recent_scans = drone_simulator.recent_scans(10)  # Last 10 scans
                 diseased_count = sum(1 for scan in recent_scans if scan['health_status'] == 'Diseased')
                 
                 if diseased_count > 3:
@@ -534,8 +534,8 @@ def start_mission():
         if drone_simulator and drone_simulator.is_flying:
             return jsonify({'success': False, 'message': 'Mission already in progress'})
         
-        # Initialize drone simulator
-        drone_simulator = DroneSimulator(field_width=500, field_height=500)
+        # Initialize drone simulator; realtime so the dashboard can follow the mission
+        drone_simulator = DroneSimulator(field_width=500, field_height=500, realtime=True)
         
         # Start mission in background thread
         def run_mission():
@@ -689,19 +689,16 @@ def generate_report():
         os.makedirs('data/mock_data', exist_ok=True)
         
         # Save scan data
-        if drone_simulator.scan_data:
-            scan_df = pd.DataFrame(drone_simulator.scan_data)
-            scan_df.to_csv('data/mock_data/scan_data.csv', index=False)
+        if drone_simulator.scan_count:
+            drone_simulator.write_scan_csv('data/mock_data/scan_data.csv')
         
         # Save spraying data
-        if drone_simulator.spraying_data:
-            spray_df = pd.DataFrame(drone_simulator.spraying_data)
-            spray_df.to_csv('data/mock_data/spraying_data.csv', index=False)
+        if drone_simulator.spray_count:
+            drone_simulator.write_spraying_csv('data/mock_data/spraying_data.csv')
         
         # Generate mission report
         mission_report = drone_simulator.generate_mission_report()
-        with open('data/mock_data/mission_report.json', 'w') as f:
-            json.dump(mission_report, f, indent=2, default=str)
+        save_report(mission_report, 'data/mock_data/mission_report.json')
         
         # Generate AI report
         report_generator = AIReportGenerator()
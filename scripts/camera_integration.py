@@ -35,6 +35,7 @@ class CameraManager:
         self.save_directory = save_directory
         os.makedirs(save_directory, exist_ok=True)
         self.active_camera = None
+        self._frame_buf = None  # aligned 640x480 preview buffer, see get_live_frame
         self.camera_settings = {
             'width': 1280,
             'height': 720,
@@ -202,7 +203,8 @@ class CameraManager:
             image_path: Path to image file
             
         Returns:
-            (success, preprocessed_data)
+            (success, preprocessed_data); 'processed_image' is in OpenCV's
+            BGR channel order
         """
         try:
             # Read image
@@ -223,12 +225,14 @@ class CameraManager:
                 image = cv2.resize(image, (new_width, new_height))
                 logger.info(f"Resized image to {new_width}x{new_height}")
             
-            # Convert to RGB (OpenCV loads as BGR)
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Calculate basic image statistics
-            brightness = np.mean(image_rgb)
-            contrast = np.std(image_rgb)
+            # Calculate basic image statistics in one OpenCV pass. Both are
+            # channel-order invariant, so the BGR image is used as loaded.
+            # Overall std is recovered from the per-channel mean/std.
+            channel_mean, channel_std = cv2.meanStdDev(image)
+            channel_mean = channel_mean.ravel()
+            channel_std = channel_std.ravel()
+            brightness = channel_mean.mean()
+            contrast = np.sqrt(max(0.0, np.mean(channel_std ** 2 + channel_mean ** 2) - brightness ** 2))
             
             # Create thumbnail
             thumbnail = cv2.resize(image, (256, 256))
@@ -243,7 +247,7 @@ class CameraManager:
                 'channels': channels,
                 'brightness': float(brightness),
                 'contrast': float(contrast),
-                'processed_image': image_rgb
+                'processed_image': image
             }
             
         except Exception as e:
@@ -312,8 +316,13 @@ class CameraManager:
             if not ret:
                 return False, None
             
-            # Reduce size for faster transmission
-            frame = cv2.resize(frame, (640, 480))
+            # Reduce size for faster transmission, into a reused aligned buffer
+            if self._frame_buf is None:
+                # Imported here so loading this module doesn't pull in the
+                # scanner and numba
+                from scripts.camera_scanner import aligned_empty
+                self._frame_buf = aligned_empty((480, 640, 3), np.uint8)
+            frame = cv2.resize(frame, (640, 480), dst=self._frame_buf)
             
             # Encode to JPEG
             _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
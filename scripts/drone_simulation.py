@@ -10,21 +10,46 @@ Date: 2024
 """
 
 import os
+import csv
+import math
 import time
-import random
+import asyncio
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import json
 import logging
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import threading
-import queue
 
 # Import our custom modules
-from scripts.image_processing import ImageProcessor, NDVIAnalyzer
+from scripts.image_processing import ImageProcessor, get_ndvi_analyzer
+
+# Numba is optional. Without it the mission kernel runs as plain Python.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# PyArrow is optional; it is only needed for Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+
+# orjson is optional; reports fall back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,40 +63,448 @@ class DronePosition:
     altitude: float
     timestamp: datetime
 
-@dataclass
+# Zone health is stored as an int8 code into this tuple
+HEALTH_STATUSES = ('Healthy', 'Diseased', 'Pest-affected')
+HEALTH_CODES = {status: code for code, status in enumerate(HEALTH_STATUSES)}
+HEALTH_DISEASED = HEALTH_CODES['Diseased']
+HEALTH_PEST_AFFECTED = HEALTH_CODES['Pest-affected']
+
+CROP_TYPES = ('Wheat', 'Rice', 'Corn', 'Soybean', 'Cotton')
+
+# Sentinel for zones that have never been sprayed
+NEVER_SPRAYED = np.iinfo(np.int64).min
+
+# Zones sprayed within this window are not sprayed again
+RESPRAY_INTERVAL_NS = 24 * 3600 * 1_000_000_000  # DroneSimulator._SEC_NS
+
+# Spraying decisions are reason codes into SPRAY_REASONS; each reason maps to
+# an action code into ACTION_TYPES and a quantity in liters
+ACTION_TYPES = ('pesticide', 'fertilizer', 'water')
+SPRAY_REASONS = (
+    'Disease detected',
+    'Pest infestation detected',
+    'Nutrient deficiency detected',
+    'Water stress detected'
+)
+REASON_ACTION = np.array([0, 0, 1, 2], np.int8)
+REASON_QUANTITY = np.array([0.5, 0.3, 0.2, 1.0])
+
+# Nutrient deficiency: NDVI below [0] with moisture above [1];
+# water stress: moisture below [2]
+DECISION_THRESHOLDS = np.array([0.3, 50.0, 30.0])
+
+# Mission physics shared by the per-step methods and the mission kernel
+ZONE_SIZE = 100.0             # 100x100 meter zones
+BATTERY_PER_METER = 0.01      # 1% per 100m
+TAKEOFF_TIME_S = 1.0
+LANDING_TIME_S = 2.0
+SCAN_TIME_S = 1.0
+SPRAY_TIME_PER_LITER_S = 2.0
+ACTION_DELAY_S = 0.5          # pause between zone visits
+MIN_MISSION_BATTERY = 20.0
+MIN_MISSION_SPRAY = 1.0       # return to base below this tank level
+PLAN_BATCH_SIZE = 16          # zone visits planned per mission cycle
+
+@njit(cache=True)
+def _reason_code(health, ndvi, moisture, thresholds):
+    """Scalar version of the DroneSimulator.decide_all rules"""
+    if health == HEALTH_DISEASED:
+        return 0
+    if health == HEALTH_PEST_AFFECTED:
+        return 1
+    if ndvi < thresholds[0] and moisture > thresholds[1]:
+        return 2
+    if moisture < thresholds[2]:
+        return 3
+    return -1
+
+@njit(cache=True)
+def _mission_kernel(order, scan_moisture, ndvi, moisture, health, last_sprayed, cx, cy,
+                    state, params, start_ns, thresholds, out_reason, out_times, out_levels):
+    """
+    Fly/scan/decide/spray over the zones in `order` until the mission ends.
+    
+    state is [x, y, battery, spray_level, sim_time] and is updated in place,
+    as are the zone moisture and last_sprayed arrays. params is
+    [flight_speed, end_time, flight_time_cap, spray_time_cap]. Per visit k,
+    out_reason[k] is the spray reason code (-1 if not sprayed), out_times[k]
+    the simulated [arrival, scan done, visit done] times and out_levels[k]
+    the [battery after flight, spray level after visit].
+    
+    Returns the number of visits completed.
+    """
+    flight_speed, end_time, flight_cap, spray_cap = params[0], params[1], params[2], params[3]
+    n = 0
+    for k in range(order.shape[0]):
+        if state[4] >= end_time or state[2] <= MIN_MISSION_BATTERY or state[3] < MIN_MISSION_SPRAY:
+            break
+        z = order[k]
+        
+        # Fly to zone center
+        distance = math.hypot(cx[z] - state[0], cy[z] - state[1])
+        state[4] += min(distance / flight_speed, flight_cap)
+        state[0] = cx[z]
+        state[1] = cy[z]
+        state[2] = max(0.0, state[2] - distance * BATTERY_PER_METER)
+        out_times[k, 0] = state[4]
+        out_levels[k, 0] = state[2]
+        
+        # Scan: the moisture sensor reading replaces the zone's value
+        state[4] += SCAN_TIME_S
+        moisture[z] = scan_moisture[k]
+        out_times[k, 1] = state[4]
+        
+        # Decide and spray if there is capacity and it was not sprayed recently
+        out_reason[k] = -1
+        reason = _reason_code(health[z], ndvi[z], moisture[z], thresholds)
+        if reason >= 0:
+            quantity = REASON_QUANTITY[reason]
+            now_ns = start_ns + np.int64(state[4] * 1e9)
+            if state[3] >= quantity and last_sprayed[z] <= now_ns - RESPRAY_INTERVAL_NS:
+                state[4] += min(quantity * SPRAY_TIME_PER_LITER_S, spray_cap)
+                state[3] = max(0.0, state[3] - quantity)
+                last_sprayed[z] = start_ns + np.int64(state[4] * 1e9)
+                out_reason[k] = reason
+        out_times[k, 2] = state[4]
+        out_levels[k, 1] = state[3]
+        n += 1
+        
+        # Small delay between actions
+        if state[3] >= MIN_MISSION_SPRAY:
+            state[4] += ACTION_DELAY_S
+    return n
+
+# Per-run results of monte_carlo, in column order
+MC_STATS = ('zones_scanned', 'zones_sprayed', 'spray_used', 'battery_consumed', 'mission_duration')
+
+@njit(cache=True)
+def _run_one_mission(seed, thresholds, zones_x, zones_y, duration, config):
+    """
+    Simulate one autonomous mission over a random zones_x by zones_y field.
+    
+    config is [flight_speed, battery_level, spray_level] at takeoff. The
+    drone flies to the nearest zone needing action by its last known state,
+    or else to the least recently scanned zone, through _mission_kernel.
+    Returns the MC_STATS for the run.
+    """
+    np.random.seed(seed)
+    n_zones = zones_x * zones_y
+    cx = np.empty(n_zones)
+    cy = np.empty(n_zones)
+    health = np.empty(n_zones, np.int8)
+    ndvi = np.empty(n_zones, np.float32)
+    moisture = np.empty(n_zones, np.float32)
+    for i in range(zones_x):
+        for j in range(zones_y):
+            z = i * zones_y + j
+            cx[z] = i * ZONE_SIZE + ZONE_SIZE / 2
+            cy[z] = j * ZONE_SIZE + ZONE_SIZE / 2
+    for z in range(n_zones):
+        health[z] = np.random.randint(0, 3)
+        ndvi[z] = np.random.uniform(0.2, 0.8)
+        moisture[z] = np.random.uniform(30.0, 80.0)
+    last_sprayed = np.full(n_zones, NEVER_SPRAYED, np.int64)
+    last_scanned = np.full(n_zones, -1.0)
+    
+    state = np.array([0.0, 0.0, config[1], config[2], TAKEOFF_TIME_S])
+    params = np.array([config[0], TAKEOFF_TIME_S + duration, np.inf, np.inf])
+    order = np.empty(1, np.int64)
+    scan_moisture = np.empty(1)
+    out_reason = np.empty(1, np.int8)
+    out_times = np.empty((1, 3))
+    out_levels = np.empty((1, 2))
+    scanned = 0
+    sprayed = 0
+    # A field smaller than one zone has nothing to visit
+    while n_zones > 0:
+        now_ns = np.int64(state[4] * 1e9)
+        best = -1
+        best_distance = np.inf
+        for z in range(n_zones):
+            if last_sprayed[z] > now_ns - RESPRAY_INTERVAL_NS:
+                continue
+            if _reason_code(health[z], ndvi[z], moisture[z], thresholds) < 0:
+                continue
+            distance = math.hypot(cx[z] - state[0], cy[z] - state[1])
+            if distance < best_distance:
+                best = z
+                best_distance = distance
+        if best < 0:
+            best = np.argmin(last_scanned)
+        
+        order[0] = best
+        scan_moisture[0] = np.random.uniform(30.0, 80.0)
+        if _mission_kernel(order, scan_moisture, ndvi, moisture, health, last_sprayed, cx, cy,
+                           state, params, np.int64(0), thresholds, out_reason, out_times, out_levels) == 0:
+            break
+        scanned += 1
+        last_scanned[best] = out_times[0, 1]
+        if out_reason[0] >= 0:
+            sprayed += 1
+    
+    stats = np.empty(5)
+    stats[0] = scanned
+    stats[1] = sprayed
+    stats[2] = config[2] - state[3]
+    stats[3] = config[1] - state[2]
+    stats[4] = state[4] + LANDING_TIME_S
+    return stats
+
+@njit(parallel=True, cache=True)
+def _monte_carlo_runs(seeds, thresholds, zones_x, zones_y, duration, config):
+    out = np.empty((len(seeds), 5))
+    for k in prange(len(seeds)):
+        out[k] = _run_one_mission(seeds[k], thresholds, zones_x, zones_y, duration, config)
+    return out
+
+def monte_carlo(seeds, thresholds, zones_x, zones_y, duration, config):
+    """
+    Run _run_one_mission for every seed, in parallel across cores when
+    numba is available. Returns a (len(seeds), len(MC_STATS)) array.
+    """
+    if NUMBA_AVAILABLE:
+        # np.random.seed inside the kernel seeds numba's own generator
+        return _monte_carlo_runs(seeds, thresholds, zones_x, zones_y, duration, config)
+    # As plain Python the runs reseed the process-wide np.random state, which
+    # other code draws from; put it back afterwards
+    saved_state = np.random.get_state()
+    try:
+        return _monte_carlo_runs(seeds, thresholds, zones_x, zones_y, duration, config)
+    finally:
+        np.random.set_state(saved_state)
+
 class FieldZone:
-    """Agricultural field zone"""
-    zone_id: str
-    center_x: float
-    center_y: float
-    width: float
-    height: float
-    crop_type: str
-    health_status: str
-    ndvi_value: float
-    moisture_level: float
-    last_sprayed: Optional[datetime] = None
+    """Agricultural field zone, a view onto one row of the simulator's zone arrays"""
+    
+    __slots__ = ('_sim', '_idx')
+    
+    def __init__(self, sim: 'DroneSimulator', idx: int):
+        self._sim = sim
+        self._idx = idx
+    
+    @property
+    def index(self) -> int:
+        return self._idx
+    
+    @property
+    def zone_id(self) -> str:
+        return self._sim.z_zone_id[self._idx]
+    
+    @property
+    def crop_type(self) -> str:
+        return CROP_TYPES[self._sim.z_crop[self._idx]]
+    
+    @property
+    def width(self) -> float:
+        return self._sim.zone_size
+    
+    @property
+    def height(self) -> float:
+        return self._sim.zone_size
+    
+    @property
+    def center_x(self) -> float:
+        return float(self._sim.z_cx[self._idx])
+    
+    @property
+    def center_y(self) -> float:
+        return float(self._sim.z_cy[self._idx])
+    
+    @property
+    def health_status(self) -> str:
+        return HEALTH_STATUSES[self._sim.z_health[self._idx]]
+    
+    @health_status.setter
+    def health_status(self, value: str):
+        self._sim.z_health[self._idx] = HEALTH_CODES[value]
+    
+    @property
+    def ndvi_value(self) -> float:
+        return float(self._sim.z_ndvi[self._idx])
+    
+    @ndvi_value.setter
+    def ndvi_value(self, value: float):
+        self._sim.z_ndvi[self._idx] = value
+    
+    @property
+    def moisture_level(self) -> float:
+        return float(self._sim.z_moist[self._idx])
+    
+    @moisture_level.setter
+    def moisture_level(self, value: float):
+        self._sim.z_moist[self._idx] = value
+    
+    @property
+    def last_sprayed(self) -> Optional[datetime]:
+        ns = int(self._sim.z_last_sprayed[self._idx])
+        return None if ns == NEVER_SPRAYED else self._sim._to_datetime(ns)
+    
+    @last_sprayed.setter
+    def last_sprayed(self, value: Optional[datetime]):
+        self._sim.z_last_sprayed[self._idx] = (
+            NEVER_SPRAYED if value is None else self._sim._from_datetime(value)
+        )
+    
+    def __repr__(self) -> str:
+        return (f"FieldZone(zone_id={self.zone_id!r}, center=({self.center_x}, {self.center_y}), "
+                f"crop_type={self.crop_type!r}, health_status={self.health_status!r}, "
+                f"ndvi_value={self.ndvi_value:.3f}, moisture_level={self.moisture_level:.1f})")
 
 @dataclass
 class SprayingAction:
     """Spraying action record"""
     action_id: str
     zone_id: str
-    timestamp: datetime
+    timestamp: int  # monotonic ns of the decision, see DroneSimulator._to_datetime
     action_type: str  # 'pesticide', 'fertilizer', 'water'
     quantity: float
     success: bool
     reason: str
 
+@dataclass(slots=True)
+class ScanResult:
+    """Simulated zone scan; derived values are computed when accessed"""
+    status: str
+    confidence: float
+    ndvi: float
+    health_variation: float
+    moisture: float  # zone moisture when the scan was taken
+    
+    @property
+    def mean_ndvi(self) -> float:
+        return self.ndvi
+    
+    @property
+    def health_score(self) -> float:
+        return max(0.0, min(1.0, self.ndvi + self.health_variation))
+    
+    @property
+    def vegetation_percentage(self) -> float:
+        return self.ndvi * 100
+    
+    @property
+    def assessment(self) -> str:
+        return 'Good' if self.ndvi > 0.5 else 'Fair'
+    
+    @property
+    def recommendations(self) -> List[str]:
+        recommendations = []
+        
+        if self.status == 'Diseased':
+            recommendations.append("Apply fungicide treatment")
+        elif self.status == 'Pest-affected':
+            recommendations.append("Apply pesticide treatment")
+        
+        if self.ndvi < 0.4:
+            recommendations.append("Increase irrigation")
+        
+        if self.moisture < 40:
+            recommendations.append("Water stress detected")
+        
+        return recommendations
+    
+    def to_dict(self) -> Dict:
+        """
+        Nested dict in the layout of ImageProcessor.process_drone_image results
+        """
+        assessment = self.assessment
+        return {
+            'crop_health': {
+                'status': self.status,
+                'confidence': self.confidence,
+                'health_score': self.health_score,
+                'recommendations': self.recommendations
+            },
+            'ndvi_analysis': {
+                'mean_ndvi': self.ndvi,
+                'health_status': assessment,
+                'vegetation_percentage': self.vegetation_percentage,
+                'recommendations': []
+            },
+            'overall_assessment': {
+                'overall_score': self.ndvi,
+                'status': assessment,
+                'priority_actions': []
+            }
+        }
+
+class _ColumnBuffer:
+    """
+    Append-only table kept as one NumPy array per column. Capacity doubles
+    when full, so appends are amortized O(1) and reading the filled rows
+    back is a slice per column.
+    """
+    
+    def __init__(self, schema: Dict[str, type], capacity: int = 256):
+        self._cols = {name: np.empty(capacity, dtype) for name, dtype in schema.items()}
+        self._n = 0
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def _reserve(self, n: int):
+        capacity = len(next(iter(self._cols.values())))
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        for name, col in self._cols.items():
+            grown = np.empty(capacity, col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[name] = grown
+    
+    def push(self, **row):
+        """Append one row given as column=value"""
+        self._reserve(self._n + 1)
+        for name, value in row.items():
+            self._cols[name][self._n] = value
+        self._n += 1
+    
+    def columns(self, start: int = 0) -> Dict[str, np.ndarray]:
+        """Views of the filled rows from `start` onwards"""
+        return {name: col[start:self._n] for name, col in self._cols.items()}
+
+# Flight log: fixed-size ring of structured records; zone is -1 for
+# events not tied to a zone
+FLIGHT_EVENTS = ('TAKEOFF', 'LANDING', 'MOVEMENT', 'SCAN', 'SPRAYING')
+FLIGHT_EVENT_CODES = {event: code for code, event in enumerate(FLIGHT_EVENTS)}
+FLIGHT_DT = np.dtype([('ts', 'i8'), ('event', 'u1'), ('zone', 'i4'), ('x', 'f4'), ('y', 'f4'),
+                      ('alt', 'f4'), ('battery', 'f4'), ('spray', 'f4')])
+FLIGHT_LOG_SIZE = 8192
+
+# Per-scan and per-spray record columns; t_ns is simulated time since start
+SCAN_SCHEMA = {'zone_idx': np.int32, 't_ns': np.int64, 'ndvi': np.float32,
+               'moisture': np.float32, 'health': np.int8}
+SPRAY_SCHEMA = {'zone_idx': np.int32, 't_ns': np.int64, 'action': np.int8,
+                'quantity': np.float64, 'success': np.bool_}
+
 class DroneSimulator:
     """
     Main drone simulation class
     """
     
-    def __init__(self, field_width: float = 1000, field_height: float = 1000):
+    _SEC_NS = 1_000_000_000
+    
+    def __init__(self, field_width: float = 1000, field_height: float = 1000,
+                 realtime: bool = False, seed: Optional[int] = None):
         self.field_width = field_width
         self.field_height = field_height
-        self.current_position = DronePosition(0, 0, 50, datetime.now())
+        
+        # Simulated clock. Timed operations advance sim_time instead of
+        # blocking; with realtime=True they also sleep (capped) as the
+        # simulation used to, e.g. for a live dashboard. Internal timestamps
+        # are int64 monotonic nanoseconds; _start_wall anchors them to a
+        # datetime only where timestamps are reported.
+        self.realtime = realtime
+        self.sim_time = 0.0
+        self._deferred_sleep = None
+        self._start_wall = datetime.now()
+        self._start_ns = time.monotonic_ns()
+        
+        self.current_position = DronePosition(0, 0, 50, self._start_wall)
+        # Single random generator for all simulated draws; pass a seed for
+        # reproducible runs
+        self.rng = np.random.default_rng(seed)
         self.battery_level = 100.0
         self.spray_tank_capacity = 10.0  # liters
         self.current_spray_level = 10.0
@@ -81,14 +514,16 @@ class DroneSimulator:
         
         # Initialize components
         self.image_processor = ImageProcessor()
-        self.ndvi_analyzer = NDVIAnalyzer()
+        self.ndvi_analyzer = get_ndvi_analyzer()
         
         # Field zones
         self.field_zones = self._create_field_zones()
         
         # Action history
         self.action_history = []
-        self.flight_log = []
+        self._spray_seq = 0
+        self.flight_log = np.empty(FLIGHT_LOG_SIZE, FLIGHT_DT)
+        self._flog_n = 0  # events logged so far; the oldest are overwritten when full
         
         # Simulation state
         self.is_flying = False
@@ -97,47 +532,72 @@ class DroneSimulator:
         self.simulation_running = False
         
         # Data collection
-        self.scan_data = []
-        self.spraying_data = []
+        self._scan_buf = _ColumnBuffer(SCAN_SCHEMA)
+        self._spray_buf = _ColumnBuffer(SPRAY_SCHEMA)
         
         logger.info("Drone simulator initialized")
     
+    def _advance(self, seconds: float, cap: float = None):
+        """
+        Advance the simulated clock, sleeping in realtime mode
+        """
+        if self.realtime:
+            if cap is not None:
+                seconds = min(seconds, cap)
+            if self._deferred_sleep is None:
+                time.sleep(seconds)
+            else:
+                self._deferred_sleep += seconds  # slept by the mission driver
+        self.sim_time += seconds
+    
+    def _sim_now(self, sim_time: float = None) -> datetime:
+        """
+        Wall-clock datetime corresponding to the current (or given) simulated time
+        """
+        if sim_time is None:
+            sim_time = self.sim_time
+        return self._start_wall + timedelta(seconds=sim_time)
+    
     def _create_field_zones(self) -> List[FieldZone]:
         """
         Create field zones for simulation
         """
-        zones = []
-        zone_size = 100  # 100x100 meter zones
+        zone_size = ZONE_SIZE
         zones_x = int(self.field_width / zone_size)
         zones_y = int(self.field_height / zone_size)
-        
-        crop_types = ['Wheat', 'Rice', 'Corn', 'Soybean', 'Cotton']
-        
-        for i in range(zones_x):
-            for j in range(zones_y):
-                zone_id = f"Zone_{i}_{j}"
-                center_x = i * zone_size + zone_size / 2
-                center_y = j * zone_size + zone_size / 2
-                
-                # Randomize initial conditions
-                health_status = random.choice(['Healthy', 'Diseased', 'Pest-affected'])
-                ndvi_value = random.uniform(0.2, 0.8)
-                moisture_level = random.uniform(30, 80)
-                
-                zone = FieldZone(
-                    zone_id=zone_id,
-                    center_x=center_x,
-                    center_y=center_y,
-                    width=zone_size,
-                    height=zone_size,
-                    crop_type=random.choice(crop_types),
-                    health_status=health_status,
-                    ndvi_value=ndvi_value,
-                    moisture_level=moisture_level
-                )
-                zones.append(zone)
-        
-        logger.info(f"Created {len(zones)} field zones")
+        n_zones = zones_x * zones_y
+        self.zone_size = zone_size
+        
+        # Grid indices in the same (i, j) order as a nested i/j loop
+        ii, jj = np.meshgrid(np.arange(zones_x), np.arange(zones_y), indexing='ij')
+        ii, jj = ii.ravel(), jj.ravel()
+        center_x = ii * zone_size + zone_size / 2
+        center_y = jj * zone_size + zone_size / 2
+        
+        # Zone state lives in parallel arrays (structure of arrays); FieldZone
+        # objects are views that read and write through to these
+        self.z_zone_id = np.array([f"Zone_{i}_{j}" for i, j in zip(ii.tolist(), jj.tolist())], dtype=object)
+        self.z_crop = np.empty(n_zones, np.int8)
+        self.z_cx = center_x.astype(np.float64)
+        self.z_cy = center_y.astype(np.float64)
+        self.z_ndvi = np.empty(n_zones, np.float32)
+        self.z_moist = np.empty(n_zones, np.float32)
+        self.z_health = np.empty(n_zones, np.int8)
+        self.z_last_sprayed = np.full(n_zones, NEVER_SPRAYED, np.int64)
+        
+        # Randomize initial conditions, one vectorized draw per attribute
+        rng = self.rng
+        self.z_health[:] = rng.integers(0, len(HEALTH_STATUSES), n_zones)
+        self.z_ndvi[:] = rng.uniform(0.2, 0.8, n_zones)
+        self.z_moist[:] = rng.uniform(30, 80, n_zones)
+        self.z_crop[:] = rng.integers(0, len(CROP_TYPES), n_zones)
+        
+        zones = [FieldZone(self, idx) for idx in range(n_zones)]
+        
+        # Zone id -> index for O(1) lookups
+        self._zone_by_id = {zone_id: idx for idx, zone_id in enumerate(self.z_zone_id.tolist())}
+        
+        logger.info("Created %d field zones", len(zones))
         return zones
     
     def takeoff(self) -> bool:
@@ -149,13 +609,13 @@ class DroneSimulator:
             return False
         
         logger.info("Drone taking off...")
-        time.sleep(1)  # Simulate takeoff time
+        self._advance(TAKEOFF_TIME_S)
         
         self.is_flying = True
         self.current_position.altitude = self.scanning_altitude
-        self.current_position.timestamp = datetime.now()
+        self.current_position.timestamp = self._sim_now()
         
-        self._log_flight_event("TAKEOFF", "Drone took off successfully")
+        self._log_flight_event("TAKEOFF")
         logger.info("Drone is now airborne")
         return True
     
@@ -168,14 +628,14 @@ class DroneSimulator:
             return False
         
         logger.info("Drone landing...")
-        time.sleep(2)  # Simulate landing time
+        self._advance(LANDING_TIME_S)
         
         self.is_flying = False
         self.is_scanning = False
         self.is_spraying = False
         self.current_position.altitude = 0
         
-        self._log_flight_event("LANDING", "Drone landed successfully")
+        self._log_flight_event("LANDING")
         logger.info("Drone has landed")
         return True
     
@@ -191,172 +651,163 @@ class DroneSimulator:
             altitude = self.current_position.altitude
         
         # Calculate distance and flight time
-        distance = np.sqrt((target_x - self.current_position.x)**2 + 
-                          (target_y - self.current_position.y)**2)
+        dx = target_x - self.current_position.x
+        dy = target_y - self.current_position.y
+        distance = math.hypot(dx, dy)
         flight_time = distance / self.flight_speed
         
-        logger.info(f"Flying to position ({target_x:.1f}, {target_y:.1f}) - Distance: {distance:.1f}m")
+        logger.info("Flying to position (%.1f, %.1f) - Distance: %.1fm", target_x, target_y, distance)
         
         # Simulate flight time
-        time.sleep(min(flight_time, 2))  # Cap simulation time
+        self._advance(flight_time, cap=2)  # Cap realtime sleep
         
         # Update position
         self.current_position.x = target_x
         self.current_position.y = target_y
         self.current_position.altitude = altitude
-        self.current_position.timestamp = datetime.now()
+        self.current_position.timestamp = self._sim_now()
         
         # Consume battery
-        self.battery_level -= distance * 0.01  # 1% per 100m
+        self.battery_level -= distance * BATTERY_PER_METER
         self.battery_level = max(0, self.battery_level)
         
-        self._log_flight_event("MOVEMENT", f"Moved to ({target_x:.1f}, {target_y:.1f})")
+        self._log_flight_event("MOVEMENT")
         return True
     
-    def scan_zone(self, zone: FieldZone) -> Dict:
+    def scan_zone(self, zone: FieldZone) -> Optional[ScanResult]:
         """
         Scan a field zone for crop health analysis
         """
         if not self.is_flying:
             logger.warning("Drone must be flying to scan")
-            return {}
+            return None
         
-        logger.info(f"Scanning zone {zone.zone_id}...")
+        logger.info("Scanning zone %s...", zone.zone_id)
         
         # Fly to zone center
         self.fly_to_position(zone.center_x, zone.center_y, self.scanning_altitude)
         
         # Simulate scanning time
-        time.sleep(1)
+        self._advance(SCAN_TIME_S)
         
         # Generate mock image data for analysis
         scan_result = self._simulate_zone_scanning(zone)
         
         # Update zone data
-        zone.health_status = scan_result['crop_health']['status']
-        zone.ndvi_value = scan_result['ndvi_analysis']['mean_ndvi']
-        zone.moisture_level = random.uniform(30, 80)  # Simulate moisture sensor
+        zone.health_status = scan_result.status
+        zone.ndvi_value = scan_result.ndvi
+        zone.moisture_level = self.rng.uniform(30, 80)  # Simulate moisture sensor
         
         # Store scan data
-        scan_data = {
-            'zone_id': zone.zone_id,
-            'timestamp': datetime.now(),
-            'position': (zone.center_x, zone.center_y),
-            'health_status': zone.health_status,
-            'ndvi_value': zone.ndvi_value,
-            'moisture_level': zone.moisture_level,
-            'scan_result': scan_result
-        }
-        self.scan_data.append(scan_data)
+        self._record_scan(zone.index, self.sim_time)
         
-        self._log_flight_event("SCAN", f"Scanned zone {zone.zone_id} - Status: {zone.health_status}")
+        self._log_flight_event("SCAN", zone.index)
         
         return scan_result
     
-    def _simulate_zone_scanning(self, zone: FieldZone) -> Dict:
+    def _simulate_zone_scanning(self, zone: FieldZone) -> ScanResult:
         """
         Simulate scanning process with realistic data
         """
-        # Simulate some randomness in health detection
-        health_variation = random.uniform(-0.2, 0.2)
-        
-        # Generate mock scan result
-        scan_result = {
-            'crop_health': {
-                'status': zone.health_status,
-                'confidence': random.uniform(0.7, 0.95),
-                'health_score': max(0, min(1, zone.ndvi_value + health_variation)),
-                'recommendations': self._get_scan_recommendations(zone)
-            },
-            'ndvi_analysis': {
-                'mean_ndvi': zone.ndvi_value,
-                'health_status': 'Good' if zone.ndvi_value > 0.5 else 'Fair',
-                'vegetation_percentage': zone.ndvi_value * 100,
-                'recommendations': []
-            },
-            'overall_assessment': {
-                'overall_score': zone.ndvi_value,
-                'status': 'Good' if zone.ndvi_value > 0.5 else 'Fair',
-                'priority_actions': []
-            }
-        }
-        
-        return scan_result
+        return ScanResult(
+            status=zone.health_status,
+            confidence=self.rng.uniform(0.7, 0.95),
+            ndvi=zone.ndvi_value,
+            health_variation=self.rng.uniform(-0.2, 0.2),  # randomness in health detection
+            moisture=zone.moisture_level
+        )
     
-    def _get_scan_recommendations(self, zone: FieldZone) -> List[str]:
+    def _now_ns(self) -> int:
         """
-        Get recommendations based on zone analysis
+        Current simulated time as integer monotonic nanoseconds, the unit of z_last_sprayed
         """
-        recommendations = []
-        
-        if zone.health_status == 'Diseased':
-            recommendations.append("Apply fungicide treatment")
-        elif zone.health_status == 'Pest-affected':
-            recommendations.append("Apply pesticide treatment")
-        
-        if zone.ndvi_value < 0.4:
-            recommendations.append("Increase irrigation")
-        
-        if zone.moisture_level < 40:
-            recommendations.append("Water stress detected")
+        return self._start_ns + round(self.sim_time * self._SEC_NS)
+    
+    def _to_datetime(self, ns: int) -> datetime:
+        """
+        Wall-clock datetime for a monotonic nanosecond timestamp
+        """
+        return self._start_wall + timedelta(microseconds=(ns - self._start_ns) // 1000)
+    
+    def _from_datetime(self, value: datetime) -> int:
+        """
+        Monotonic nanosecond timestamp for a wall-clock datetime
+        """
+        return self._start_ns + (value - self._start_wall) // timedelta(microseconds=1) * 1000
+    
+    def decide_all(self, zones=slice(None)) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        AI-powered spraying decisions for many zones at once
         
-        return recommendations
+        Args:
+            zones: Index (slice or index array) into the zone arrays; all zones by default
+            
+        Returns:
+            (needs, action_code, quantity, reason_code) arrays; codes index
+            ACTION_TYPES / SPRAY_REASONS and are -1 where no spraying is needed.
+            Zones sprayed within RESPRAY_INTERVAL_NS have needs=False but keep
+            their reason code.
+        """
+        health = self.z_health[zones]
+        ndvi = self.z_ndvi[zones]
+        moisture = self.z_moist[zones]
+        
+        # Decision logic based on health status and conditions, first match wins
+        reason_code = np.select(
+            [
+                health == HEALTH_CODES['Diseased'],
+                health == HEALTH_CODES['Pest-affected'],
+                (ndvi < DECISION_THRESHOLDS[0]) & (moisture > DECISION_THRESHOLDS[1]),
+                moisture < DECISION_THRESHOLDS[2]
+            ],
+            [0, 1, 2, 3],
+            default=-1
+        ).astype(np.int8)
+        has_reason = reason_code >= 0
+        action_code = np.where(has_reason, REASON_ACTION[reason_code], -1).astype(np.int8)
+        quantity = np.where(has_reason, REASON_QUANTITY[reason_code], 0.0)
+        
+        # Mask out recently sprayed zones (avoid over-spraying)
+        recent = self.z_last_sprayed[zones] > self._now_ns() - RESPRAY_INTERVAL_NS
+        needs = has_reason & ~recent
+        
+        return needs, action_code, quantity, reason_code
     
     def decide_spraying_action(self, zone: FieldZone) -> Optional[SprayingAction]:
         """
         AI-powered decision making for spraying actions
         """
-        # Check if spraying is needed
-        needs_spraying = False
-        action_type = None
-        quantity = 0.0
-        reason = ""
-        
-        # Decision logic based on health status and conditions
-        if zone.health_status == 'Diseased':
-            needs_spraying = True
-            action_type = 'pesticide'
-            quantity = 0.5  # liters
-            reason = "Disease detected"
-        elif zone.health_status == 'Pest-affected':
-            needs_spraying = True
-            action_type = 'pesticide'
-            quantity = 0.3  # liters
-            reason = "Pest infestation detected"
-        elif zone.ndvi_value < 0.3 and zone.moisture_level > 50:
-            needs_spraying = True
-            action_type = 'fertilizer'
-            quantity = 0.2  # liters
-            reason = "Nutrient deficiency detected"
-        elif zone.moisture_level < 30:
-            needs_spraying = True
-            action_type = 'water'
-            quantity = 1.0  # liters
-            reason = "Water stress detected"
+        needs, action_code, quantity, reason_code = self.decide_all(slice(zone.index, zone.index + 1))
+        if reason_code[0] < 0:
+            return None
+        quantity = float(quantity[0])
         
         # Check if enough spray capacity
-        if needs_spraying and self.current_spray_level < quantity:
-            logger.warning(f"Insufficient spray capacity: {self.current_spray_level:.1f}L < {quantity:.1f}L")
+        if self.current_spray_level < quantity:
+            logger.warning("Insufficient spray capacity: %.1fL < %.1fL", self.current_spray_level, quantity)
             return None
         
         # Check if recently sprayed (avoid over-spraying)
-        if zone.last_sprayed and (datetime.now() - zone.last_sprayed) < timedelta(hours=24):
-            logger.info(f"Zone {zone.zone_id} recently sprayed, skipping")
+        if not needs[0]:
+            logger.info("Zone %s recently sprayed, skipping", zone.zone_id)
             return None
         
-        if needs_spraying:
-            action = SprayingAction(
-                action_id=f"SPRAY_{zone.zone_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                zone_id=zone.zone_id,
-                timestamp=datetime.now(),
-                action_type=action_type,
-                quantity=quantity,
-                success=False,
-                reason=reason
-            )
-            return action
-        
-        return None
+        return SprayingAction(
+            action_id=self._next_action_id(zone.zone_id),
+            zone_id=zone.zone_id,
+            timestamp=self._now_ns(),
+            action_type=ACTION_TYPES[action_code[0]],
+            quantity=quantity,
+            success=False,
+            reason=SPRAY_REASONS[reason_code[0]]
+        )
+    
+    def _next_action_id(self, zone_id: str) -> str:
+        """
+        Unique spraying action id from a per-simulator sequence number
+        """
+        self._spray_seq += 1
+        return f"SPRAY_{zone_id}_{self._spray_seq}"
     
     def execute_spraying(self, action: SprayingAction) -> bool:
         """
@@ -367,55 +818,89 @@ class DroneSimulator:
             return False
         
         # Find the zone
-        zone = next((z for z in self.field_zones if z.zone_id == action.zone_id), None)
-        if not zone:
-            logger.error(f"Zone {action.zone_id} not found")
+        idx = self._zone_by_id.get(action.zone_id)
+        if idx is None:
+            logger.error("Zone %s not found", action.zone_id)
             return False
+        zone = self.field_zones[idx]
         
-        logger.info(f"Executing spraying action: {action.action_type} ({action.quantity}L) in {action.zone_id}")
+        logger.info("Executing spraying action: %s (%sL) in %s",
+                    action.action_type, action.quantity, action.zone_id)
         
         # Fly to zone
         self.fly_to_position(zone.center_x, zone.center_y, self.spraying_altitude)
         
         # Simulate spraying time
-        spraying_time = action.quantity * 2  # 2 seconds per liter
-        time.sleep(min(spraying_time, 3))  # Cap simulation time
+        spraying_time = action.quantity * SPRAY_TIME_PER_LITER_S
+        self._advance(spraying_time, cap=3)  # Cap realtime sleep
         
         # Update spray tank level
         self.current_spray_level -= action.quantity
         self.current_spray_level = max(0, self.current_spray_level)
         
         # Update zone
-        zone.last_sprayed = datetime.now()
+        self.z_last_sprayed[zone.index] = self._now_ns()
         
         # Mark action as successful
         action.success = True
         
         # Store spraying data
-        self.spraying_data.append({
-            'action_id': action.action_id,
-            'zone_id': action.zone_id,
-            'timestamp': action.timestamp,
-            'action_type': action.action_type,
-            'quantity': action.quantity,
-            'position': (zone.center_x, zone.center_y),
-            'success': action.success
-        })
+        self._spray_buf.push(
+            zone_idx=zone.index,
+            t_ns=action.timestamp - self._start_ns,
+            action=ACTION_TYPES.index(action.action_type),
+            quantity=action.quantity,
+            success=action.success
+        )
         
         self.action_history.append(action)
         
-        self._log_flight_event("SPRAYING", f"Sprayed {action.action_type} in {action.zone_id}")
+        self._log_flight_event("SPRAYING", zone.index)
         
-        logger.info(f"Spraying completed successfully")
+        logger.info("Spraying completed successfully")
         return True
     
     def autonomous_mission(self, mission_duration: int = 300) -> Dict:
         """
         Run autonomous mission for specified duration (seconds)
         """
-        logger.info(f"Starting autonomous mission for {mission_duration} seconds")
+        mission = self._mission_cycles(mission_duration)
+        try:
+            while True:
+                wait = next(mission)
+                try:
+                    if wait:
+                        time.sleep(wait)
+                except KeyboardInterrupt:
+                    mission.throw(KeyboardInterrupt())
+        except StopIteration as done:
+            return done.value
+    
+    async def autonomous_mission_async(self, mission_duration: int = 300) -> Dict:
+        """
+        Run autonomous mission for specified duration (seconds), yielding to
+        the event loop between planning cycles so several drones can fly
+        concurrently (see fleet_mission)
+        """
+        mission = self._mission_cycles(mission_duration)
+        try:
+            while True:
+                await asyncio.sleep(next(mission))
+        except StopIteration as done:
+            return done.value
+        finally:
+            mission.close()  # lands the drone if the task is cancelled
+    
+    def _mission_cycles(self, mission_duration: int):
+        """
+        Mission driver shared by the sync and async entry points. Yields the
+        seconds to wait after each planning cycle (non-zero only in realtime
+        mode) and returns the mission stats.
+        """
+        logger.info("Starting autonomous mission for %s seconds", mission_duration)
         
-        start_time = datetime.now()
+        start_sim = self.sim_time
+        start_time = self._sim_now()
         end_time = start_time + timedelta(seconds=mission_duration)
         
         mission_stats = {
@@ -431,76 +916,394 @@ class DroneSimulator:
         initial_battery = self.battery_level
         initial_spray = self.current_spray_level
         
-        # Takeoff
+        # Takeoff; its realtime wait is yielded like the planning cycles
+        self._deferred_sleep = 0.0
         if not self.takeoff():
+            self._deferred_sleep = None
             return mission_stats
         
+        # Zone visits run through the mission kernel in chunks; realtime
+        # missions go one visit at a time so they can sleep in between
+        n_zones = len(self.field_zones)
+        chunk = 1 if self.realtime else min(PLAN_BATCH_SIZE, n_zones)
+        state = np.empty(5)
+        params = np.array([
+            self.flight_speed,
+            start_sim + mission_duration,
+            2.0 if self.realtime else np.inf,  # same caps as _advance in realtime mode
+            3.0 if self.realtime else np.inf
+        ])
+        out_reason = np.empty(chunk, np.int8)
+        out_times = np.empty((chunk, 3))
+        out_levels = np.empty((chunk, 2))
+        
         try:
-            while datetime.now() < end_time and self.battery_level > 20:
-                # Select random zone for scanning
-                zone = random.choice(self.field_zones)
-                
-                # Scan zone
-                scan_result = self.scan_zone(zone)
-                mission_stats['zones_scanned'] += 1
+            yield self._deferred_sleep
+            self._deferred_sleep = None
+            
+            while self.is_flying:
+                # Plan a batch of zones and tour it nearest-neighbor first
+                order = self._zone_visit_order(chunk)
+                if len(order) == 0:
+                    # Field smaller than one zone; nothing to visit
+                    logger.warning("No field zones to visit, returning to base")
+                    break
+                scan_moisture = self.rng.uniform(30, 80, chunk)  # Simulate moisture sensor
                 
-                # Decide on spraying action
-                action = self.decide_spraying_action(zone)
+                chunk_start = self.sim_time
+                state[:] = (self.current_position.x, self.current_position.y,
+                            self.battery_level, self.current_spray_level, self.sim_time)
+                n = _mission_kernel(
+                    order, scan_moisture, self.z_ndvi, self.z_moist, self.z_health,
+                    self.z_last_sprayed, self.z_cx, self.z_cy, state, params,
+                    self._start_ns, DECISION_THRESHOLDS, out_reason, out_times, out_levels
+                )
+                self._record_visits(order[:n], scan_moisture, out_reason, out_times, out_levels,
+                                    mission_stats)
                 
-                if action:
-                    # Execute spraying
-                    if self.execute_spraying(action):
-                        mission_stats['zones_sprayed'] += 1
-                        mission_stats['total_spray_used'] += action.quantity
-                        mission_stats['actions_taken'].append({
-                            'action_id': action.action_id,
-                            'zone_id': action.zone_id,
-                            'action_type': action.action_type,
-                            'quantity': action.quantity,
-                            'reason': action.reason
-                        })
+                self.current_position.x, self.current_position.y = float(state[0]), float(state[1])
+                self.battery_level = float(state[2])
+                self.current_spray_level = float(state[3])
+                self.sim_time = float(state[4])
+                self.current_position.timestamp = self._sim_now()
+                yield self.sim_time - chunk_start if self.realtime else 0
                 
                 # Check if need to return for refill
-                if self.current_spray_level < 1.0:
+                if self.current_spray_level < MIN_MISSION_SPRAY:
                     logger.info("Low spray capacity, returning to base")
                     break
-                
-                # Small delay between actions
-                time.sleep(0.5)
+                if n < len(order):
+                    break
         
         except KeyboardInterrupt:
             logger.info("Mission interrupted by user")
         
         finally:
             # Land
+            self._deferred_sleep = 0.0
             self.land()
+            landing_wait, self._deferred_sleep = self._deferred_sleep, None
+        yield landing_wait
         
         # Calculate final stats
         mission_stats['battery_consumed'] = initial_battery - self.battery_level
         mission_stats['spray_remaining'] = self.current_spray_level
-        mission_stats['mission_duration'] = (datetime.now() - start_time).total_seconds()
+        mission_stats['mission_duration'] = self.sim_time - start_sim
         
-        logger.info("Autonomous mission completed")
-        logger.info(f"Zones scanned: {mission_stats['zones_scanned']}")
-        logger.info(f"Zones sprayed: {mission_stats['zones_sprayed']}")
-        logger.info(f"Spray used: {mission_stats['total_spray_used']:.1f}L")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Autonomous mission completed")
+            logger.info("Zones scanned: %d", mission_stats['zones_scanned'])
+            logger.info("Zones sprayed: %d", mission_stats['zones_sprayed'])
+            logger.info("Spray used: %.1fL", mission_stats['total_spray_used'])
         
         return mission_stats
     
-    def _log_flight_event(self, event_type: str, description: str):
+    def monte_carlo(self, n_runs: int = 10_000, mission_duration: int = 300,
+                    thresholds: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Simulate many independent missions over random fields the size of this one
+        
+        Args:
+            n_runs: Number of missions; each gets its own random field
+            mission_duration: Mission duration in seconds
+            thresholds: Decision thresholds to evaluate (see DECISION_THRESHOLDS)
+            
+        Returns:
+            Per-run arrays keyed by MC_STATS
+        """
+        seeds = self.rng.integers(0, 2**31 - 1, n_runs)
+        if thresholds is None:
+            thresholds = DECISION_THRESHOLDS
+        config = np.array([self.flight_speed, self.battery_level, self.spray_tank_capacity])
+        stats = monte_carlo(
+            seeds, np.asarray(thresholds, np.float64),
+            int(self.field_width / ZONE_SIZE), int(self.field_height / ZONE_SIZE),
+            float(mission_duration), config
+        )
+        return dict(zip(MC_STATS, stats.T))
+    
+    def distances_to_all_zones(self) -> np.ndarray:
         """
-        Log flight events
+        Distance from the drone to every zone center
         """
-        event = {
-            'timestamp': datetime.now(),
-            'event_type': event_type,
-            'description': description,
-            'position': (self.current_position.x, self.current_position.y),
-            'altitude': self.current_position.altitude,
-            'battery_level': self.battery_level,
-            'spray_level': self.current_spray_level
+        return np.hypot(self.z_cx - self.current_position.x, self.z_cy - self.current_position.y)
+    
+    def _plan_indices(self, k: int) -> np.ndarray:
+        """
+        Indices of up to k zones needing action, highest priority first:
+        diseased zones, then larger spray quantities, then nearer zones
+        """
+        needs, _, quantity, _ = self.decide_all()
+        candidates = np.flatnonzero(needs)
+        priority = np.lexsort((
+            self.distances_to_all_zones()[candidates],
+            -quantity[candidates],
+            self.z_health[candidates] != HEALTH_CODES['Diseased']
+        ))
+        return candidates[priority[:k]]
+    
+    def plan_batch(self, k: int = 16) -> List[Tuple[int, str, float]]:
+        """
+        Plan the next batch of spraying actions from the zones' last known state
+        
+        Args:
+            k: Maximum number of actions to plan
+            
+        Returns:
+            (zone index, action type, quantity) tuples, highest priority first
+        """
+        _, action_code, quantity, _ = self.decide_all()
+        return [
+            (idx, ACTION_TYPES[action_code[idx]], float(quantity[idx]))
+            for idx in self._plan_indices(k).tolist()
+        ]
+    
+    def _nearest_neighbor_tour(self, zone_idx: np.ndarray) -> np.ndarray:
+        """
+        Order zones greedily, always flying to the nearest unvisited one
+        """
+        tour = np.empty_like(zone_idx)
+        remaining = zone_idx
+        distances = self.distances_to_all_zones()[remaining]
+        for step in range(len(zone_idx)):
+            nearest = int(np.argmin(distances))
+            tour[step] = idx = remaining[nearest]
+            remaining = np.delete(remaining, nearest)
+            distances = np.hypot(self.z_cx[remaining] - self.z_cx[idx],
+                                 self.z_cy[remaining] - self.z_cy[idx])
+        return tour
+    
+    def _zone_visit_order(self, k: int) -> np.ndarray:
+        """
+        Zones to visit next: a nearest-neighbor tour over the planned batch,
+        topped up with the nearest other zones so the drone keeps scanning
+        when fewer than k zones need action
+        """
+        batch = self._plan_indices(k)
+        if len(batch) < k:
+            others = np.argsort(self.distances_to_all_zones(), kind='stable')
+            others = others[~np.isin(others, batch)]
+            return np.concatenate((self._nearest_neighbor_tour(batch), others[:k - len(batch)]))
+        return self._nearest_neighbor_tour(batch)
+    
+    def _record_visits(self, order: np.ndarray, scan_moisture: np.ndarray, reasons: np.ndarray,
+                       times: np.ndarray, levels: np.ndarray, mission_stats: Dict):
+        """
+        Record scans, spraying actions and flight events for zone visits
+        simulated by the mission kernel
+        """
+        log_info = logger.isEnabledFor(logging.INFO)
+        spray_level = self.current_spray_level
+        for k, idx in enumerate(order.tolist()):
+            zone = self.field_zones[idx]
+            arrived, scanned, done = times[k].tolist()
+            battery, spray_after = levels[k].tolist()
+            position = (zone.center_x, zone.center_y)
+            
+            self._log_flight_event("MOVEMENT", idx, sim_time=arrived, position=position, altitude=self.scanning_altitude,
+                                   battery_level=battery, spray_level=spray_level)
+            
+            if log_info:
+                logger.info("Scanning zone %s...", zone.zone_id)
+            self._scan_buf.push(zone_idx=idx, t_ns=round(scanned * self._SEC_NS), ndvi=self.z_ndvi[idx],
+                                moisture=scan_moisture[k], health=self.z_health[idx])
+            self._log_flight_event("SCAN", idx, sim_time=scanned, position=position, altitude=self.scanning_altitude,
+                                   battery_level=battery, spray_level=spray_level)
+            mission_stats['zones_scanned'] += 1
+            
+            reason = int(reasons[k])
+            if reason >= 0:
+                decided_ns = round(scanned * self._SEC_NS)
+                action = SprayingAction(
+                    action_id=self._next_action_id(zone.zone_id),
+                    zone_id=zone.zone_id,
+                    timestamp=self._start_ns + decided_ns,
+                    action_type=ACTION_TYPES[REASON_ACTION[reason]],
+                    quantity=float(REASON_QUANTITY[reason]),
+                    success=True,
+                    reason=SPRAY_REASONS[reason]
+                )
+                if log_info:
+                    logger.info("Executing spraying action: %s (%sL) in %s",
+                                action.action_type, action.quantity, action.zone_id)
+                self._log_flight_event("MOVEMENT", idx, sim_time=scanned, position=position, altitude=self.spraying_altitude,
+                                       battery_level=battery, spray_level=spray_level)
+                self._spray_buf.push(zone_idx=idx, t_ns=decided_ns, action=REASON_ACTION[reason],
+                                     quantity=action.quantity, success=True)
+                self.action_history.append(action)
+                self._log_flight_event("SPRAYING", idx, sim_time=done, position=position, altitude=self.spraying_altitude,
+                                       battery_level=battery, spray_level=spray_after)
+                
+                mission_stats['zones_sprayed'] += 1
+                mission_stats['total_spray_used'] += action.quantity
+                mission_stats['actions_taken'].append({
+                    'action_id': action.action_id,
+                    'zone_id': action.zone_id,
+                    'action_type': action.action_type,
+                    'quantity': action.quantity,
+                    'reason': action.reason
+                })
+                self.current_position.altitude = self.spraying_altitude
+            else:
+                self.current_position.altitude = self.scanning_altitude
+            spray_level = spray_after
+    
+    def _record_scan(self, idx: int, sim_time: float):
+        """
+        Append the current state of zone `idx` to the scan buffer
+        """
+        self._scan_buf.push(zone_idx=idx, t_ns=round(sim_time * self._SEC_NS), ndvi=self.z_ndvi[idx],
+                            moisture=self.z_moist[idx], health=self.z_health[idx])
+    
+    def _timestamps(self, t_ns: np.ndarray) -> np.ndarray:
+        """
+        datetime64 timestamps for simulated-time offsets in nanoseconds, at the
+        microsecond resolution of datetime
+        """
+        return np.datetime64(self._start_wall, 'us') + (t_ns // 1000).astype('timedelta64[us]')
+    
+    @property
+    def scan_count(self) -> int:
+        return len(self._scan_buf)
+    
+    @property
+    def spray_count(self) -> int:
+        return len(self._spray_buf)
+    
+    def scan_records(self, start: int = 0) -> Dict[str, np.ndarray]:
+        """
+        Scan records as columns (zone_id, timestamp, position_x, position_y,
+        health_status, ndvi_value, moisture_level)
+        """
+        cols = self._scan_buf.columns(start)
+        idx = cols['zone_idx']
+        return {
+            'zone_id': self.z_zone_id[idx],
+            'timestamp': self._timestamps(cols['t_ns']),
+            'position_x': self.z_cx[idx],
+            'position_y': self.z_cy[idx],
+            'health_status': np.array(HEALTH_STATUSES)[cols['health']],
+            'ndvi_value': cols['ndvi'],
+            'moisture_level': cols['moisture']
+        }
+    
+    def spraying_records(self, start: int = 0) -> Dict[str, np.ndarray]:
+        """
+        Spraying records as columns (action_id, zone_id, timestamp, action_type,
+        quantity, position_x, position_y, success)
+        """
+        cols = self._spray_buf.columns(start)
+        idx = cols['zone_idx']
+        # action_history is appended in step with the spray buffer
+        action_ids = [action.action_id for action in self.action_history[start:]]
+        return {
+            'action_id': np.array(action_ids, dtype=object),
+            'zone_id': self.z_zone_id[idx],
+            'timestamp': self._timestamps(cols['t_ns']),
+            'action_type': np.array(ACTION_TYPES)[cols['action']],
+            'quantity': cols['quantity'],
+            'position_x': self.z_cx[idx],
+            'position_y': self.z_cy[idx],
+            'success': cols['success']
         }
-        self.flight_log.append(event)
+    
+    def recent_scans(self, n: int = 10) -> List[Dict]:
+        """
+        The last `n` scan records as dicts
+        """
+        cols = self.scan_records(max(0, self.scan_count - n))
+        return [dict(zip(cols, row)) for row in zip(*(col.tolist() for col in cols.values()))]
+    
+    def scan_frame(self) -> 'pd.DataFrame':
+        """
+        All scan records as a DataFrame
+        """
+        import pandas as pd
+        return pd.DataFrame(self.scan_records())
+    
+    def spraying_frame(self) -> 'pd.DataFrame':
+        """
+        All spraying records as a DataFrame
+        """
+        import pandas as pd
+        return pd.DataFrame(self.spraying_records())
+    
+    @staticmethod
+    def _write_csv(path: str, records: Dict[str, np.ndarray]):
+        """
+        Stream column records to a CSV file, one row per record
+        """
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(records.keys())
+            writer.writerows(zip(*(col.tolist() for col in records.values())))
+    
+    def write_scan_csv(self, path: str):
+        """
+        Write the scan records to a CSV file
+        """
+        self._write_csv(path, self.scan_records())
+    
+    def write_spraying_csv(self, path: str):
+        """
+        Write the spraying records to a CSV file
+        """
+        self._write_csv(path, self.spraying_records())
+    
+    def scan_buffer_to_arrow(self) -> 'pa.Table':
+        """
+        Scan records as an Arrow table (requires pyarrow)
+        """
+        return pa.table(self.scan_records())
+    
+    def spraying_buffer_to_arrow(self) -> 'pa.Table':
+        """
+        Spraying records as an Arrow table (requires pyarrow)
+        """
+        return pa.table(self.spraying_records())
+    
+    def write_parquet(self, output_dir: str):
+        """
+        Write scan and spraying records as Parquet files (requires pyarrow)
+        """
+        pq.write_table(self.scan_buffer_to_arrow(), os.path.join(output_dir, 'scan_data.parquet'))
+        pq.write_table(self.spraying_buffer_to_arrow(), os.path.join(output_dir, 'spraying_data.parquet'))
+    
+    def _log_flight_event(self, event_type: str, zone_idx: int = -1, sim_time: float = None,
+                          position: Tuple[float, float] = None, altitude: float = None,
+                          battery_level: float = None, spray_level: float = None):
+        """
+        Log flight events; state defaults to the drone's current state
+        """
+        if sim_time is None:
+            sim_time = self.sim_time
+        if position is None:
+            position = (self.current_position.x, self.current_position.y)
+        self.flight_log[self._flog_n % FLIGHT_LOG_SIZE] = (
+            round(sim_time * self._SEC_NS),
+            FLIGHT_EVENT_CODES[event_type],
+            zone_idx,
+            position[0],
+            position[1],
+            altitude if altitude is not None else self.current_position.altitude,
+            battery_level if battery_level is not None else self.battery_level,
+            spray_level if spray_level is not None else self.current_spray_level
+        )
+        self._flog_n += 1
+    
+    @property
+    def flight_event_count(self) -> int:
+        """Total number of flight events logged, including any overwritten"""
+        return self._flog_n
+    
+    def flight_events(self) -> np.ndarray:
+        """
+        Retained flight log records (FLIGHT_DT), oldest first
+        """
+        if self._flog_n <= FLIGHT_LOG_SIZE:
+            return self.flight_log[:self._flog_n]
+        start = self._flog_n % FLIGHT_LOG_SIZE
+        return np.concatenate((self.flight_log[start:], self.flight_log[:start]))
     
     def get_status(self) -> Dict:
         """
@@ -518,7 +1321,7 @@ class DroneSimulator:
             'is_scanning': self.is_scanning,
             'is_spraying': self.is_spraying,
             'field_zones': len(self.field_zones),
-            'zones_scanned': len(self.scan_data),
+            'zones_scanned': self.scan_count,
             'actions_taken': len(self.action_history)
         }
     
@@ -527,44 +1330,47 @@ class DroneSimulator:
         Generate comprehensive mission report
         """
         # Analyze scan data
-        health_distribution = {}
-        ndvi_values = []
-        
-        for scan in self.scan_data:
-            status = scan['health_status']
-            health_distribution[status] = health_distribution.get(status, 0) + 1
-            ndvi_values.append(scan['ndvi_value'])
+        scans = self._scan_buf.columns()
+        health_counts = np.bincount(scans['health'], minlength=len(HEALTH_STATUSES))
+        health_distribution = dict(zip(HEALTH_STATUSES, health_counts.tolist()))
+        ndvi_values = scans['ndvi']
         
         # Analyze spraying data
-        spray_summary = {}
-        for spray in self.spraying_data:
-            action_type = spray['action_type']
-            if action_type not in spray_summary:
-                spray_summary[action_type] = {'count': 0, 'total_quantity': 0}
-            spray_summary[action_type]['count'] += 1
-            spray_summary[action_type]['total_quantity'] += spray['quantity']
+        sprays = self._spray_buf.columns()
+        spray_counts = np.bincount(sprays['action'], minlength=len(ACTION_TYPES))
+        spray_totals = np.bincount(sprays['action'], weights=sprays['quantity'], minlength=len(ACTION_TYPES))
+        spray_summary = {
+            action_type: {'count': count, 'total_quantity': total}
+            for action_type, count, total in zip(ACTION_TYPES, spray_counts.tolist(), spray_totals.tolist())
+            if count
+        }
         
         report = {
             'mission_summary': {
-                'total_zones_scanned': len(self.scan_data),
-                'total_actions_taken': len(self.spraying_data),
-                'mission_duration': len(self.flight_log),
+                'total_zones_scanned': self.scan_count,
+                'total_actions_taken': self.spray_count,
+                'mission_duration': self._flog_n,
                 'battery_consumed': 100 - self.battery_level,
                 'spray_consumed': 10 - self.current_spray_level
             },
             'crop_health_analysis': {
                 'health_distribution': health_distribution,
-                'average_ndvi': np.mean(ndvi_values) if ndvi_values else 0,
-                'healthy_percentage': (health_distribution.get('Healthy', 0) / len(self.scan_data) * 100) if self.scan_data else 0
+                'average_ndvi': float(ndvi_values.mean()) if ndvi_values.size else 0,
+                'healthy_percentage': (health_distribution.get('Healthy', 0) / self.scan_count * 100) if self.scan_count else 0,
+                'field_health_distribution': dict(zip(
+                    HEALTH_STATUSES,
+                    np.bincount(self.z_health, minlength=len(HEALTH_STATUSES)).tolist()
+                )),
+                'field_average_ndvi': float(self.z_ndvi.mean()) if self.z_ndvi.size else 0
             },
             'spraying_analysis': spray_summary,
             'recommendations': self._generate_recommendations(health_distribution, ndvi_values),
-            'timestamp': datetime.now()
+            'timestamp': self._sim_now()
         }
         
         return report
     
-    def _generate_recommendations(self, health_distribution: Dict, ndvi_values: List[float]) -> List[str]:
+    def _generate_recommendations(self, health_distribution: Dict, ndvi_values: np.ndarray) -> List[str]:
         """
         Generate recommendations based on mission data
         """
@@ -581,13 +1387,56 @@ class DroneSimulator:
             if pest_percentage > 20:
                 recommendations.append("Significant pest activity - implement integrated pest management")
             
-            if ndvi_values:
-                avg_ndvi = np.mean(ndvi_values)
+            if ndvi_values.size:
+                avg_ndvi = ndvi_values.mean()
                 if avg_ndvi < 0.4:
                     recommendations.append("Low vegetation health - improve irrigation and fertilization")
         
         return recommendations
 
+def _json_default(obj):
+    """
+    json fallback for the types orjson serializes natively
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    return str(obj)
+
+def save_report(report: Dict, path: str):
+    """
+    Write a mission report as indented JSON
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(report, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        with open(path, 'wb') as f:
+            f.write(data)
+    else:
+        import json
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=_json_default)
+
+async def fleet_mission(drones: List[DroneSimulator], mission_duration: int = 300) -> List[Dict]:
+    """
+    Fly autonomous missions for several drones concurrently
+    
+    Args:
+        drones: Simulators to fly, one per drone
+        mission_duration: Mission duration in seconds
+        
+    Returns:
+        Mission stats per drone, in the order given
+    """
+    return await asyncio.gather(*(drone.autonomous_mission_async(mission_duration) for drone in drones))
+
+def run_fleet_mission(drones: List[DroneSimulator], mission_duration: int = 300) -> List[Dict]:
+    """
+    Blocking wrapper around fleet_mission for callers without an event loop
+    """
+    return asyncio.run(fleet_mission(drones, mission_duration))
+
 def main():
     """
     Main function for testing drone simulation
@@ -634,17 +1483,14 @@ def main():
     # Save mission data
     os.makedirs('data/mock_data', exist_ok=True)
     
-    # Save scan data
-    scan_df = pd.DataFrame(drone.scan_data)
-    scan_df.to_csv('data/mock_data/scan_data.csv', index=False)
-    
-    # Save spraying data
-    spray_df = pd.DataFrame(drone.spraying_data)
-    spray_df.to_csv('data/mock_data/spraying_data.csv', index=False)
+    # Save scan and spraying data
+    drone.write_scan_csv('data/mock_data/scan_data.csv')
+    drone.write_spraying_csv('data/mock_data/spraying_data.csv')
+    if PYARROW_AVAILABLE:
+        drone.write_parquet('data/mock_data')
     
     # Save mission report
-    with open('data/mock_data/mission_report.json', 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    save_report(report, 'data/mock_data/mission_report.json')
     
     print(f"\nMission data saved to data/mock_data/")
     print("Drone simulation completed successfully!")
@@ -10,8 +10,17 @@ Date: 2024
 """
 
 import os
+import importlib.util
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 import numpy as np
-import pandas as pd
+import logging
+from typing import Dict, List, Tuple, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # OpenCV is optional
 try:
@@ -21,23 +30,126 @@ except Exception:
     CV2_AVAILABLE = False
     cv2 = None
 
-# TensorFlow is optional. Attempt to import, otherwise fall back to rule-based logic.
+# TensorFlow is optional, otherwise fall back to rule-based logic. It takes seconds
+# to import, so it is only loaded (via _tf) once a model file is actually found.
+TF_AVAILABLE = importlib.util.find_spec('tensorflow') is not None
+_tf_module = None
+
+
+def _tf():
+    """
+    Import TensorFlow on first use
+    """
+    global _tf_module
+    if _tf_module is None:
+        import tensorflow
+        _tf_module = tensorflow
+    return _tf_module
+
+
+# Numba is optional. Without it NDVI is computed with plain NumPy.
 try:
-    import tensorflow as tf
-    from tensorflow import keras
-    TF_AVAILABLE = True
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
 except Exception:
-    TF_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+# Cython single-pass NDVI kernel is optional. pyximport pulls in the Cython
+# compiler, so the kernel is built/loaded on first use rather than at import.
+CYTHON_NDVI_AVAILABLE = importlib.util.find_spec('pyximport') is not None
+_ndvi_all = None
+
+
+def _cython_ndvi_all():
+    """
+    Load the Cython NDVI kernel on first use, or None if it cannot be built
+    """
+    global _ndvi_all, CYTHON_NDVI_AVAILABLE
+    if _ndvi_all is None and CYTHON_NDVI_AVAILABLE:
+        try:
+            import pyximport
+            pyximport.install(language_level=3)
+            from scripts.ndvi_kernel import ndvi_all
+            _ndvi_all = ndvi_all
+        except Exception as e:
+            logger.warning(f"Cython NDVI kernel unavailable: {str(e)}")
+            CYTHON_NDVI_AVAILABLE = False
+    return _ndvi_all
+
+
+# Crop health recommendations, indexed like CropHealthDetector.class_names
+HEALTHY_RECOMMENDATIONS = (
+    "Continue current farming practices",
+    "Monitor regularly for early signs of disease",
+    "Maintain proper irrigation and nutrition",
+)
+DISEASED_RECOMMENDATIONS = (
+    "Apply appropriate fungicide treatment",
+    "Improve air circulation around plants",
+    "Remove infected plant parts",
+    "Consider crop rotation for next season",
+)
+PEST_RECOMMENDATIONS = (
+    "Apply targeted pesticide treatment",
+    "Introduce beneficial insects",
+    "Use physical barriers or traps",
+    "Monitor pest population levels",
+)
+RECOMMENDATIONS_BY_CLASS = (HEALTHY_RECOMMENDATIONS, DISEASED_RECOMMENDATIONS, PEST_RECOMMENDATIONS)
+LOW_CONFIDENCE_RECOMMENDATION = "Manual inspection recommended due to low confidence"
+
+# Pseudo class probabilities reported by the rule-based fallback
+RULE_BASED_PREDICTIONS = {
+    'Healthy': (0.8, 0.1, 0.1),
+    'Diseased': (0.1, 0.8, 0.1),
+    'Pest-affected': (0.15, 0.15, 0.7),
+}
+
+# Smallest side the rule-based health estimate is computed on
+RULE_BASED_MIN_SIDE = 256
+
+
+def imread_reduced(image_path: str, min_side: int) -> Optional[np.ndarray]:
+    """
+    Decode an image at 1/4 scale when that still leaves min_side pixels
     
-import matplotlib.pyplot as plt
-from PIL import Image
-import json
-import logging
-from typing import Dict, List, Tuple, Optional
+    JPEG decoders downscale by 2/4/8 while decoding, which is far cheaper than a
+    full decode followed by cv2.resize. Small images are re-read at full size.
+    """
+    img = cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_4)
+    if img is None or min(img.shape[:2]) >= min_side:
+        return img
+    return cv2.imread(image_path)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _ndvi_kernel(nir, red, out):
+        # Cast, sum, zero guard, divide and clip in one pass over each row
+        for i in prange(nir.shape[0]):
+            for j in range(nir.shape[1]):
+                n = np.float32(nir[i, j])
+                r = np.float32(red[i, j])
+                d = n + r
+                d = max(d, np.float32(1e-10))
+                out[i, j] = min(np.float32(1.0), max(np.float32(-1.0), (n - r) / d))
+
+    @njit(cache=True)
+    def _ndvi_stats_kernel(flat):
+        # Sum, sum of squares, min and max in a single sweep
+        total = 0.0
+        total_sq = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for k in range(flat.size):
+            v = np.float64(flat[k])
+            total += v
+            total_sq += v * v
+            lo = min(lo, v)
+            hi = max(hi, v)
+        mean = total / flat.size
+        var = max(total_sq / flat.size - mean * mean, 0.0)
+        return mean, np.sqrt(var), lo, hi
 
 class CropHealthDetector:
     """
@@ -47,17 +159,30 @@ class CropHealthDetector:
     def __init__(self, model_path: str = 'model/crop_health_model.h5'):
         self.model_path = model_path
         self.model = None
+        # INT8 TFLite interpreter, preferred over the Keras model when present
+        self.interpreter = None
+        self._input_details = None
+        self._output_details = None
         self.class_names = ['Healthy', 'Diseased', 'Pest-affected']
+        self._status_to_idx = {name: i for i, name in enumerate(self.class_names)}
         self.img_size = (224, 224)
+        # Reused model input, (1, H, W, 3) float32
+        self._preproc_buf = np.empty((1, self.img_size[1], self.img_size[0], 3), dtype=np.float32)
+        # Serializes model calls; the input buffer and TFLite interpreter are shared state
+        self._lock = threading.Lock()
         self.load_model()
     
     def load_model(self):
         """
-        Load the trained CNN model
+        Load the trained CNN model, preferring an INT8 .tflite export next to it
         """
         try:
-            if TF_AVAILABLE and os.path.exists(self.model_path):
-                self.model = keras.models.load_model(self.model_path)
+            tflite_path = os.path.splitext(self.model_path)[0] + '.tflite'
+            if TF_AVAILABLE and os.path.exists(tflite_path):
+                self._load_tflite(tflite_path)
+                logger.info(f"TFLite model loaded from {tflite_path}")
+            elif TF_AVAILABLE and os.path.exists(self.model_path):
+                self.model = _tf().keras.models.load_model(self.model_path)
                 logger.info(f"Model loaded from {self.model_path}")
             else:
                 if not TF_AVAILABLE:
@@ -68,27 +193,138 @@ class CropHealthDetector:
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             self.model = None
+            self.interpreter = None
+    
+    def _load_tflite(self, path: str):
+        """
+        Create the TFLite interpreter and cache its tensor details
+        """
+        self.interpreter = _tf().lite.Interpreter(model_path=path)
+        self.interpreter.allocate_tensors()
+        self._input_details = self.interpreter.get_input_details()[0]
+        self._output_details = self.interpreter.get_output_details()[0]
+    
+    @property
+    def has_model(self) -> bool:
+        """
+        True when a trained model (TFLite or Keras) is loaded
+        """
+        return self.interpreter is not None or self.model is not None
+    
+    def _predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities for a preprocessed float32 batch
+        """
+        if self.interpreter is None:
+            return self.model.predict(batch, verbose=0)
+        
+        inp = self._input_details
+        if inp['shape'][0] != len(batch):
+            # Grow/shrink the interpreter's batch dimension to fit this call
+            self.interpreter.resize_tensor_input(inp['index'], batch.shape)
+            self.interpreter.allocate_tensors()
+            self._input_details = inp = self.interpreter.get_input_details()[0]
+            self._output_details = self.interpreter.get_output_details()[0]
+        out = self._output_details
+        if inp['dtype'] == np.int8:
+            # Quantize with the input tensor's own scale/zero-point
+            scale, zero_point = inp['quantization']
+            batch = np.clip(np.round(batch / scale + zero_point), -128, 127).astype(np.int8)
+        self.interpreter.set_tensor(inp['index'], batch)
+        self.interpreter.invoke()
+        predictions = self.interpreter.get_tensor(out['index'])
+        if out['dtype'] == np.int8:
+            scale, zero_point = out['quantization']
+            predictions = (predictions.astype(np.float32) - zero_point) * scale
+        return predictions
     
-    def _rule_based_health(self, image_rgb: np.ndarray) -> dict:
+    @classmethod
+    def convert_to_tflite(cls, keras_model_path: str = 'model/crop_health_model.h5',
+                          output_path: Optional[str] = None,
+                          calibration_dir: str = 'data/sample_images',
+                          num_calibration: int = 300,
+                          img_size: Tuple[int, int] = (224, 224)) -> str:
+        """
+        Export a Keras model to a full-integer INT8 .tflite file
+        
+        Args:
+            keras_model_path: Trained .h5 model
+            output_path: Destination, defaults to the model path with .tflite
+            calibration_dir: Images used as the representative dataset
+            num_calibration: Number of calibration images to use
+            img_size: Model input size (width, height)
+        
+        Returns:
+            Path of the written .tflite file
+        """
+        if not TF_AVAILABLE:
+            raise RuntimeError("TensorFlow is required to convert models to TFLite")
+        
+        exts = ('.jpg', '.jpeg', '.png', '.bmp')
+        image_paths = []
+        for root, _, files in os.walk(calibration_dir):
+            image_paths.extend(os.path.join(root, f) for f in sorted(files) if f.lower().endswith(exts))
+        image_paths = image_paths[:num_calibration]
+        if not image_paths:
+            raise ValueError(f"No calibration images found in {calibration_dir}")
+        
+        def representative_dataset():
+            for path in image_paths:
+                img = cv2.imread(path)
+                if img is None:
+                    continue
+                img = cv2.resize(img, img_size, interpolation=cv2.INTER_AREA)
+                img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+                yield [img[np.newaxis].astype(np.float32)]
+        
+        tf = _tf()
+        model = tf.keras.models.load_model(keras_model_path)
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        tflite_model = converter.convert()
+        
+        output_path = output_path or os.path.splitext(keras_model_path)[0] + '.tflite'
+        with open(output_path, 'wb') as f:
+            f.write(tflite_model)
+        logger.info(f"INT8 TFLite model written to {output_path} ({len(image_paths)} calibration images)")
+        return output_path
+    
+    def _rule_based_health(self, image_bgr: np.ndarray) -> dict:
         """
         Simple rule-based crop health estimation using vegetation indices.
-        Returns a structure similar to model output.
+        Takes the image in OpenCV's BGR order and returns a structure similar
+        to model output.
         """
-        # Compute Excess Green (ExG = 2G - R - B)
-        r = image_rgb[:, :, 0].astype(np.float32)
-        g = image_rgb[:, :, 1].astype(np.float32)
-        b = image_rgb[:, :, 2].astype(np.float32)
-        exg = 2 * g - r - b
-        exg_norm = cv2.normalize(exg, None, 0.0, 1.0, cv2.NORM_MINMAX)
+        # score = 0.5 * minmax(ExG) + 0.5 * (VARI + 1) / 2 is only used through
+        # its mean, so reduce ExG to min/max/mean and VARI to its mean instead
+        # of materialising the normalised arrays
+        img = image_bgr.astype(np.float32, copy=False)
+        b, g, r = img[:, :, 0], img[:, :, 1], img[:, :, 2]
+        buf = np.empty(img.shape[:2], np.float32)
+        tmp = np.empty_like(buf)
+
+        # Excess Green (ExG = 2G - R - B)
+        exg = np.multiply(g, 2.0, out=buf)
+        exg -= r
+        exg -= b
+        exg_min, exg_max = float(exg.min()), float(exg.max())
+        exg_mean = float(exg.sum(dtype=np.float64)) / exg.size
+        exg_norm_mean = (exg_mean - exg_min) / (exg_max - exg_min) if exg_max > exg_min else 0.0
 
         # VARI = (G - R) / (G + R - B)
-        denom = (g + r - b)
-        vari = (g - r) / (denom + 1e-6)
-        vari = np.clip(vari, -1.0, 1.0)
-        vari_norm = (vari + 1.0) / 2.0
+        denom = np.add(g, r, out=tmp)
+        denom -= b
+        denom += 1e-6
+        vari = np.subtract(g, r, out=buf)
+        vari /= denom
+        np.clip(vari, -1.0, 1.0, out=vari)
+        vari_norm_mean = (float(vari.sum(dtype=np.float64)) / vari.size + 1.0) / 2.0
 
-        score = 0.5 * exg_norm + 0.5 * vari_norm
-        mean_score = float(np.mean(score))
+        mean_score = 0.5 * exg_norm_mean + 0.5 * vari_norm_mean
 
         # Thresholds can be tuned per crop/lighting
         if mean_score > 0.6:
@@ -99,12 +335,7 @@ class CropHealthDetector:
             status = 'Diseased'
 
         # Construct a pseudo "all_predictions"
-        if status == 'Healthy':
-            preds = [0.8, 0.1, 0.1]
-        elif status == 'Diseased':
-            preds = [0.1, 0.8, 0.1]
-        else:
-            preds = [0.15, 0.15, 0.7]
+        preds = RULE_BASED_PREDICTIONS[status]
 
         confidence = max(preds)
         return {
@@ -112,39 +343,72 @@ class CropHealthDetector:
             'confidence': float(confidence),
             'all_predictions': {name: float(p) for name, p in zip(self.class_names, preds)},
             'health_score': float(mean_score),
-            'recommendations': self._get_recommendations(
-                [0,1,2][['Healthy','Diseased','Pest-affected'].index(status)], confidence
-            )
+            'recommendations': self._get_recommendations(self._status_to_idx[status], confidence)
         }
     
+    def _read_input(self, image_path: str, out: np.ndarray) -> np.ndarray:
+        """
+        Load and resize one image into an (H, W, 3) float32 slot
+        """
+        # Load image, decoding at reduced scale when it stays above the model size
+        img = imread_reduced(image_path, min(self.img_size))
+        if img is None:
+            raise ValueError(f"Could not load image from {image_path}")
+        
+        # Resize first so the colour conversion and copy touch fewer pixels;
+        # tiles already at the model size skip it
+        if img.shape[1::-1] != self.img_size:
+            img = cv2.resize(img, self.img_size, interpolation=cv2.INTER_AREA)
+        
+        # Convert BGR to RGB in place
+        cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
+        
+        # Raw [0, 255] pixels straight into the batch buffer; the model's
+        # Rescaling layer normalizes them
+        np.copyto(out, img)
+        return out
+    
     def preprocess_image(self, image_path: str) -> np.ndarray:
         """
         Preprocess image for model input
         """
         try:
-            # Load image
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError(f"Could not load image from {image_path}")
-            
-            # Convert BGR to RGB
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            
-            # Resize image
-            img = cv2.resize(img, self.img_size)
-            
-            # Normalize pixel values
-            img = img.astype(np.float32) / 255.0
-            
-            # Add batch dimension
-            img = np.expand_dims(img, axis=0)
-            
-            return img
+            self._read_input(image_path, self._preproc_buf[0])
+            return self._preproc_buf
         
         except Exception as e:
             logger.error(f"Error preprocessing image: {str(e)}")
             # Return dummy image if preprocessing fails
-            return np.random.random((1, *self.img_size, 3)).astype(np.float32)
+            return (np.random.random((1, *self.img_size, 3)) * 255).astype(np.float32)
+    
+    def _model_result(self, predictions: np.ndarray) -> Dict:
+        """
+        Build the analysis dict from one row of class probabilities
+        """
+        predicted_class_idx = int(np.argmax(predictions))
+        confidence = float(predictions[predicted_class_idx])
+        return {
+            'status': self.class_names[predicted_class_idx],
+            'confidence': confidence,
+            'all_predictions': {
+                class_name: float(pred)
+                for class_name, pred in zip(self.class_names, predictions)
+            },
+            'health_score': self._calculate_health_score(predictions),
+            'recommendations': self._get_recommendations(predicted_class_idx, confidence)
+        }
+    
+    def _unknown_result(self) -> Dict:
+        """
+        Placeholder result for images that could not be analyzed
+        """
+        return {
+            'status': 'Unknown',
+            'confidence': 0.0,
+            'all_predictions': {name: 0.33 for name in self.class_names},
+            'health_score': 0.5,
+            'recommendations': ['Manual inspection required']
+        }
     
     def analyze_crop_health(self, image_path: str) -> Dict:
         """
@@ -152,42 +416,64 @@ class CropHealthDetector:
         """
         try:
             # If model is available, use it; otherwise use rule-based fallback
-            if self.model is not None:
-                processed_img = self.preprocess_image(image_path)
-                predictions = self.model.predict(processed_img, verbose=0)
-                predicted_class_idx = np.argmax(predictions[0])
-                confidence = float(predictions[0][predicted_class_idx])
-                result = {
-                    'status': self.class_names[predicted_class_idx],
-                    'confidence': confidence,
-                    'all_predictions': {
-                        class_name: float(pred)
-                        for class_name, pred in zip(self.class_names, predictions[0])
-                    },
-                    'health_score': self._calculate_health_score(predictions[0]),
-                    'recommendations': self._get_recommendations(predicted_class_idx, confidence)
-                }
-                logger.info(f"Crop health analysis (model): {result['status']} (confidence: {confidence:.2f})")
+            if self.has_model:
+                with self._lock:
+                    processed_img = self.preprocess_image(image_path)
+                    predictions = self._predict(processed_img)
+                result = self._model_result(predictions[0])
+                logger.info(f"Crop health analysis (model): {result['status']} (confidence: {result['confidence']:.2f})")
                 return result
             else:
-                # Rule-based path reads the raw image at original size
-                img_bgr = cv2.imread(image_path)
+                # Rule-based path only needs image-wide statistics, so decode reduced
+                img_bgr = imread_reduced(image_path, RULE_BASED_MIN_SIDE)
                 if img_bgr is None:
                     raise ValueError(f"Could not load image from {image_path}")
-                img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-                result = self._rule_based_health(img_rgb)
+                result = self._rule_based_health(img_bgr)
                 logger.info(f"Crop health analysis (rule-based): {result['status']} (confidence: {result['confidence']:.2f})")
                 return result
         
         except Exception as e:
             logger.error(f"Error analyzing crop health: {str(e)}")
-            return {
-                'status': 'Unknown',
-                'confidence': 0.0,
-                'all_predictions': {name: 0.33 for name in self.class_names},
-                'health_score': 0.5,
-                'recommendations': ['Manual inspection required']
-            }
+            return self._unknown_result()
+    
+    def analyze_batch(self, image_paths: List[str]) -> List[Dict]:
+        """
+        Analyze several images with a single model call
+        
+        Args:
+            image_paths: Images to analyze
+        
+        Returns:
+            One analysis dict per path, in order. Images that fail to load get
+            the 'Unknown' result.
+        """
+        if not self.has_model:
+            return [self.analyze_crop_health(path) for path in image_paths]
+        
+        results: List[Optional[Dict]] = [None] * len(image_paths)
+        batch = np.empty((len(image_paths), self.img_size[1], self.img_size[0], 3), dtype=np.float32)
+        loaded = []
+        for i, path in enumerate(image_paths):
+            try:
+                self._read_input(path, batch[len(loaded)])
+                loaded.append(i)
+            except Exception as e:
+                logger.error(f"Error preprocessing image: {str(e)}")
+                results[i] = self._unknown_result()
+        
+        if loaded:
+            try:
+                with self._lock:
+                    predictions = self._predict(batch[:len(loaded)])
+                for row, i in enumerate(loaded):
+                    results[i] = self._model_result(predictions[row])
+            except Exception as e:
+                logger.error(f"Error analyzing crop health batch: {str(e)}")
+                for i in loaded:
+                    results[i] = self._unknown_result()
+        
+        logger.info(f"Crop health analysis (model): {len(loaded)}/{len(image_paths)} images in one batch")
+        return results
     
     def _calculate_health_score(self, predictions: np.ndarray) -> float:
         """
@@ -205,33 +491,10 @@ class CropHealthDetector:
         """
         Get recommendations based on prediction
         """
-        recommendations = []
-        
-        if predicted_class == 0:  # Healthy
-            recommendations.extend([
-                "Continue current farming practices",
-                "Monitor regularly for early signs of disease",
-                "Maintain proper irrigation and nutrition"
-            ])
-        elif predicted_class == 1:  # Diseased
-            recommendations.extend([
-                "Apply appropriate fungicide treatment",
-                "Improve air circulation around plants",
-                "Remove infected plant parts",
-                "Consider crop rotation for next season"
-            ])
-        else:  # Pest-affected
-            recommendations.extend([
-                "Apply targeted pesticide treatment",
-                "Introduce beneficial insects",
-                "Use physical barriers or traps",
-                "Monitor pest population levels"
-            ])
-        
+        recommendations = RECOMMENDATIONS_BY_CLASS[predicted_class]
         if confidence < 0.7:
-            recommendations.append("Manual inspection recommended due to low confidence")
-        
-        return recommendations
+            return [*recommendations, LOW_CONFIDENCE_RECOMMENDATION]
+        return list(recommendations)
 
 class NDVIAnalyzer:
     """
@@ -239,13 +502,20 @@ class NDVIAnalyzer:
     """
     
     def __init__(self):
-        self.ndvi_ranges = {
-            'water': (-1.0, 0.0),
-            'soil': (0.0, 0.2),
-            'sparse_vegetation': (0.2, 0.5),
-            'moderate_vegetation': (0.5, 0.7),
-            'dense_vegetation': (0.7, 1.0)
-        }
+        self._category_names = (
+            'water', 'soil', 'sparse_vegetation', 'moderate_vegetation', 'dense_vegetation'
+        )
+        # Lower edges of every category after the first, for np.digitize
+        self._category_edges = (0.0, 0.2, 0.5, 0.7)
+        self._category_bins = np.array(self._category_edges, dtype=np.float32)
+    
+    @property
+    def ndvi_ranges(self) -> Dict[str, Tuple[float, float]]:
+        """
+        NDVI (min, max) range of each category, in classification order
+        """
+        edges = (-1.0, *self._category_edges, 1.0)
+        return {name: (edges[i], edges[i + 1]) for i, name in enumerate(self._category_names)}
     
     def calculate_ndvi(self, nir_band: np.ndarray, red_band: np.ndarray) -> np.ndarray:
         """
@@ -254,44 +524,68 @@ class NDVIAnalyzer:
         NDVI = (NIR - RED) / (NIR + RED)
         """
         try:
+            if NUMBA_AVAILABLE and nir_band.ndim == 2 and nir_band.shape == red_band.shape:
+                ndvi = np.empty(nir_band.shape, dtype=np.float32)
+                _ndvi_kernel(nir_band, red_band, ndvi)
+                return ndvi
+
             # Ensure arrays are float to avoid integer division
             nir = nir_band.astype(np.float32)
             red = red_band.astype(np.float32)
             
-            # Avoid division by zero
+            # Avoid division by zero (bands are non-negative reflectances)
             denominator = nir + red
-            denominator[denominator == 0] = 1e-10
+            np.maximum(denominator, 1e-10, out=denominator)
             
-            # Calculate NDVI
-            ndvi = (nir - red) / denominator
+            # Calculate NDVI, reusing the NIR copy for the result
+            ndvi = np.subtract(nir, red, out=nir)
+            ndvi /= denominator
             
             # Clip values to valid range [-1, 1]
-            ndvi = np.clip(ndvi, -1.0, 1.0)
+            np.clip(ndvi, -1.0, 1.0, out=ndvi)
             
             return ndvi
         
         except Exception as e:
             logger.error(f"Error calculating NDVI: {str(e)}")
-            return np.zeros_like(nir_band)
+            return np.zeros(np.shape(nir_band), dtype=np.float32)
     
     def generate_mock_ndvi_data(self, width: int = 100, height: int = 100) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate mock NIR and Red band data for demonstration
         """
-        # Create realistic vegetation patterns
-        x = np.linspace(0, 10, width)
-        y = np.linspace(0, 10, height)
-        X, Y = np.meshgrid(x, y)
+        nir_band, red_band = self.generate_mock_bands(width, height)
         
-        # Simulate different vegetation zones
-        vegetation_pattern = (
-            0.8 * np.exp(-((X-3)**2 + (Y-3)**2) / 2) +  # Dense vegetation area
-            0.6 * np.exp(-((X-7)**2 + (Y-7)**2) / 3) +  # Moderate vegetation
-            0.3 * np.exp(-((X-5)**2 + (Y-2)**2) / 4)    # Sparse vegetation
+        # Calculate NDVI
+        ndvi = self.calculate_ndvi(nir_band, red_band)
+        
+        return nir_band, red_band, ndvi
+    
+    def generate_mock_bands(self, width: int = 100, height: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate mock uint8 NIR and Red bands
+        """
+        # Create realistic vegetation patterns. Each Gaussian blob is separable,
+        # so it is the outer product of a row and a column profile.
+        x = np.linspace(0, 10, width, dtype=np.float32)
+        y = np.linspace(0, 10, height, dtype=np.float32)
+        blobs = (
+            (0.8, 3.0, 3.0, 2.0),  # Dense vegetation area
+            (0.6, 7.0, 7.0, 3.0),  # Moderate vegetation
+            (0.3, 5.0, 2.0, 4.0),  # Sparse vegetation
         )
         
+        # Simulate different vegetation zones
+        vegetation_pattern = np.zeros((height, width), dtype=np.float32)
+        blob = np.empty_like(vegetation_pattern)
+        for amplitude, cx, cy, spread in blobs:
+            gx = amplitude * np.exp(-(x - cx) ** 2 / spread)
+            gy = np.exp(-(y - cy) ** 2 / spread)
+            np.multiply.outer(gy, gx, out=blob)
+            vegetation_pattern += blob
+        
         # Add noise
-        noise = np.random.normal(0, 0.1, (height, width))
+        noise = np.random.normal(0, 0.1, (height, width)).astype(np.float32, copy=False)
         vegetation_pattern += noise
         
         # Generate NIR and Red bands
@@ -301,45 +595,78 @@ class NDVIAnalyzer:
         # Red band is typically lower for vegetation
         red_band = np.clip((1 - vegetation_pattern * 0.7) * 255, 0, 255).astype(np.uint8)
         
-        # Calculate NDVI
-        ndvi = self.calculate_ndvi(nir_band, red_band)
-        
-        return nir_band, red_band, ndvi
+        return nir_band, red_band
     
     def classify_ndvi(self, ndvi: np.ndarray) -> np.ndarray:
         """
         Classify NDVI values into vegetation categories
         """
-        classification = np.zeros_like(ndvi, dtype=int)
-        
-        for i, (category, (min_val, max_val)) in enumerate(self.ndvi_ranges.items()):
-            mask = (ndvi >= min_val) & (ndvi < max_val)
-            classification[mask] = i
-        
-        return classification
+        # Indices follow _category_names (water .. dense_vegetation)
+        return np.digitize(ndvi, self._category_bins).astype(np.int8)
     
     def analyze_vegetation_health(self, ndvi: np.ndarray) -> Dict:
         """
         Analyze vegetation health from NDVI data
         """
         # Calculate statistics
-        mean_ndvi = np.mean(ndvi)
-        std_ndvi = np.std(ndvi)
-        min_ndvi = np.min(ndvi)
-        max_ndvi = np.max(ndvi)
+        flat = ndvi.ravel()
+        if NUMBA_AVAILABLE:
+            mean_ndvi, std_ndvi, min_ndvi, max_ndvi = _ndvi_stats_kernel(flat)
+        elif CV2_AVAILABLE and flat.size:
+            # Two OpenCV passes (mean+std, min+max) instead of four reductions
+            column = np.ascontiguousarray(flat, dtype=np.float32).reshape(-1, 1)
+            mean, std = cv2.meanStdDev(column)
+            mean_ndvi, std_ndvi = mean.item(), std.item()
+            min_ndvi, max_ndvi, _, _ = cv2.minMaxLoc(column)
+        else:
+            mean_ndvi = flat.mean()
+            std_ndvi = flat.std()
+            min_ndvi = flat.min()
+            max_ndvi = flat.max()
         
-        # Classify vegetation
+        # Classify vegetation and count pixels in each category
         classification = self.classify_ndvi(ndvi)
+        counts = np.bincount(classification.ravel(), minlength=len(self._category_names))
+        
+        return self._health_result(mean_ndvi, std_ndvi, min_ndvi, max_ndvi, counts)
+    
+    def analyze_bands(self, nir_band: np.ndarray, red_band: np.ndarray) -> Tuple[np.ndarray, Dict]:
+        """
+        Compute NDVI from NIR/Red bands and analyze it
+        
+        With the Cython kernel, NDVI, classification, category counts and
+        statistics all come from one pass over the bands.
+        
+        Returns:
+            (ndvi, analysis) where analysis matches analyze_vegetation_health
+        """
+        ndvi_all = None
+        if (CYTHON_NDVI_AVAILABLE and nir_band.ndim == 2 and nir_band.shape == red_band.shape
+                and nir_band.dtype == red_band.dtype
+                and nir_band.dtype in (np.uint8, np.uint16, np.float32)):
+            ndvi_all = _cython_ndvi_all()
+        if ndvi_all is not None:
+            ndvi = np.empty(nir_band.shape, dtype=np.float32)
+            classification = np.empty(nir_band.shape, dtype=np.int8)
+            counts, mean_ndvi, std_ndvi, min_ndvi, max_ndvi = ndvi_all(
+                np.ascontiguousarray(nir_band), np.ascontiguousarray(red_band),
+                ndvi, classification, self._category_bins
+            )
+            return ndvi, self._health_result(mean_ndvi, std_ndvi, min_ndvi, max_ndvi, counts)
         
-        # Count pixels in each category
-        category_counts = {}
-        for i, category in enumerate(self.ndvi_ranges.keys()):
-            count = np.sum(classification == i)
-            category_counts[category] = int(count)
+        ndvi = self.calculate_ndvi(nir_band, red_band)
+        return ndvi, self.analyze_vegetation_health(ndvi)
+    
+    def _health_result(self, mean_ndvi: float, std_ndvi: float, min_ndvi: float,
+                       max_ndvi: float, counts: np.ndarray) -> Dict:
+        """
+        Build the vegetation health dict from NDVI statistics and category counts
+        """
+        category_counts = dict(zip(self._category_names, counts.tolist()))
         
         # Calculate vegetation percentage
-        total_pixels = ndvi.size
-        vegetation_pixels = category_counts['moderate_vegetation'] + category_counts['dense_vegetation']
+        total_pixels = int(counts.sum())
+        vegetation_pixels = int(counts[3] + counts[4])  # moderate + dense
         vegetation_percentage = (vegetation_pixels / total_pixels) * 100
         
         # Health assessment
@@ -401,14 +728,60 @@ class NDVIAnalyzer:
         
         return recommendations
 
+# Shared instances handed out by get_health_detector / get_ndvi_analyzer
+_SHARED_HEALTH_DETECTORS: Dict[str, CropHealthDetector] = {}
+_SHARED_NDVI_ANALYZER: Optional[NDVIAnalyzer] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_health_detector(model_path: str = 'model/crop_health_model.h5') -> CropHealthDetector:
+    """
+    Shared CropHealthDetector for model_path, loading the model on first use
+    """
+    detector = _SHARED_HEALTH_DETECTORS.get(model_path)
+    if detector is None:
+        with _SHARED_LOCK:
+            detector = _SHARED_HEALTH_DETECTORS.get(model_path)
+            if detector is None:
+                detector = _SHARED_HEALTH_DETECTORS[model_path] = CropHealthDetector(model_path)
+    return detector
+
+
+def get_ndvi_analyzer() -> NDVIAnalyzer:
+    """
+    Shared NDVIAnalyzer instance
+    """
+    global _SHARED_NDVI_ANALYZER
+    if _SHARED_NDVI_ANALYZER is None:
+        with _SHARED_LOCK:
+            if _SHARED_NDVI_ANALYZER is None:
+                _SHARED_NDVI_ANALYZER = NDVIAnalyzer()
+    return _SHARED_NDVI_ANALYZER
+
+
+# Per-process ImageProcessor used by ImageProcessor.process_images workers
+_WORKER_PROCESSOR = None
+
+
+def _init_worker():
+    global _WORKER_PROCESSOR
+    # Forked workers inherit the parent's RNG state; reseed so mock NDVI differs
+    np.random.seed()
+    _WORKER_PROCESSOR = ImageProcessor()
+
+
+def _process_chunk(image_paths: List[str]) -> List[Dict]:
+    return _WORKER_PROCESSOR.process_drone_image_batch(image_paths)
+
+
 class ImageProcessor:
     """
     Main image processing class that combines all functionalities
     """
     
     def __init__(self):
-        self.health_detector = CropHealthDetector()
-        self.ndvi_analyzer = NDVIAnalyzer()
+        self.health_detector = get_health_detector()
+        self.ndvi_analyzer = get_ndvi_analyzer()
     
     def process_drone_image(self, image_path: str) -> Dict:
         """
@@ -419,31 +792,86 @@ class ImageProcessor:
         try:
             # Crop health analysis
             health_analysis = self.health_detector.analyze_crop_health(image_path)
-            
-            # Generate mock NDVI data (in real scenario, this would come from multispectral camera)
-            nir_band, red_band, ndvi = self.ndvi_analyzer.generate_mock_ndvi_data()
-            
-            # NDVI analysis
-            ndvi_analysis = self.ndvi_analyzer.analyze_vegetation_health(ndvi)
-            
-            # Combine results
-            result = {
-                'image_path': image_path,
-                'crop_health': health_analysis,
-                'ndvi_analysis': ndvi_analysis,
-                'processing_timestamp': str(pd.Timestamp.now()),
-                'overall_assessment': self._get_overall_assessment(health_analysis, ndvi_analysis)
-            }
-            
-            return result
+            return self._combine_analysis(image_path, health_analysis)
         
         except Exception as e:
             logger.error(f"Error processing drone image: {str(e)}")
-            return {
-                'image_path': image_path,
-                'error': str(e),
-                'processing_timestamp': str(pd.Timestamp.now())
-            }
+            return self._error_result(image_path, e)
+    
+    def process_drone_image_batch(self, image_paths: List[str]) -> List[Dict]:
+        """
+        Process several drone images, running crop health as one model batch
+        """
+        logger.info(f"Processing {len(image_paths)} drone images")
+        
+        try:
+            health_analyses = self.health_detector.analyze_batch(image_paths)
+        except Exception as e:
+            logger.error(f"Error processing drone image batch: {str(e)}")
+            return [self._error_result(path, e) for path in image_paths]
+        
+        results = []
+        for image_path, health_analysis in zip(image_paths, health_analyses):
+            try:
+                results.append(self._combine_analysis(image_path, health_analysis))
+            except Exception as e:
+                logger.error(f"Error processing drone image: {str(e)}")
+                results.append(self._error_result(image_path, e))
+        return results
+    
+    def process_images(self, image_paths: List[str], max_workers: Optional[int] = None,
+                       batch_size: int = 8) -> List[Dict]:
+        """
+        Process many drone images across worker processes
+        
+        Each worker builds its own ImageProcessor once (so the model loads once
+        per process) and runs crop health on chunks of batch_size images.
+        
+        Args:
+            image_paths: Images to process
+            max_workers: Worker processes, defaults to the CPU count
+            batch_size: Images per model batch inside a worker
+        
+        Returns:
+            One result per path, in order
+        """
+        if len(image_paths) <= batch_size:
+            return self.process_drone_image_batch(image_paths)
+        
+        chunks = [image_paths[i:i + batch_size] for i in range(0, len(image_paths), batch_size)]
+        max_workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+        logger.info(f"Processing {len(image_paths)} drone images on {max_workers} workers")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            return [result for chunk in executor.map(_process_chunk, chunks) for result in chunk]
+    
+    def _combine_analysis(self, image_path: str, health_analysis: Dict) -> Dict:
+        """
+        Add NDVI analysis and the overall assessment to a crop health result
+        """
+        # Generate mock bands (in real scenario, these would come from multispectral camera)
+        nir_band, red_band = self.ndvi_analyzer.generate_mock_bands()
+        
+        # NDVI analysis
+        ndvi, ndvi_analysis = self.ndvi_analyzer.analyze_bands(nir_band, red_band)
+        
+        # Combine results
+        return {
+            'image_path': image_path,
+            'crop_health': health_analysis,
+            'ndvi_analysis': ndvi_analysis,
+            'processing_timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'overall_assessment': self._get_overall_assessment(health_analysis, ndvi_analysis)
+        }
+    
+    def _error_result(self, image_path: str, error: Exception) -> Dict:
+        """
+        Result returned when an image could not be processed
+        """
+        return {
+            'image_path': image_path,
+            'error': str(error),
+            'processing_timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds')
+        }
     
     def _get_overall_assessment(self, health_analysis: Dict, ndvi_analysis: Dict) -> Dict:
         """
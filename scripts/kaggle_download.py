@@ -21,6 +21,8 @@ import os
 import sys
 import argparse
 import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,7 +42,47 @@ def check_kaggle_credentials():
     return False
 
 
-def download_dataset(dataset: str, dest: Path):
+def _extract_members(zip_path: Path, names, dest: Path):
+    """Extract the given members using this thread's own ZipFile handle."""
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in names:
+            zf.extract(name, dest)
+
+
+def _member_dir(name: str) -> str:
+    """Folder a member needs before it can be extracted ('' for the root)."""
+    # Same component filtering ZipFile.extract applies to member names; a
+    # directory member ('a/b/') needs its own folder
+    parts = [p for p in name.split('/') if p not in ('', '.', '..')]
+    if not name.endswith('/'):
+        parts = parts[:-1]
+    return os.path.join(*parts) if parts else ''
+
+
+def extract_zip(zip_path: Path, dest: Path, workers: int = 1) -> int:
+    """Extract an archive into dest and return the number of files it held."""
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = zf.infolist()
+        file_count = sum(not info.is_dir() for info in infos)
+        if workers <= 1:
+            zf.extractall(dest)
+            return file_count
+
+    # ZipFile.extract creates missing parent folders without exist_ok, which
+    # races between threads, so create every folder up front
+    for folder in {_member_dir(info.filename) for info in infos}:
+        (dest / folder).mkdir(parents=True, exist_ok=True)
+
+    # Extraction is IO-bound; split members across threads, one handle each
+    names = [info.filename for info in infos]
+    chunks = [names[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(_extract_members, zip_path, chunk, dest) for chunk in chunks if chunk]:
+            future.result()
+    return file_count
+
+
+def download_dataset(dataset: str, dest: Path, workers: int = 1):
     """Download and extract a Kaggle dataset using the Kaggle API."""
     try:
         from kaggle.api.kaggle_api_extended import KaggleApi
@@ -64,12 +106,15 @@ def download_dataset(dataset: str, dest: Path):
 
     try:
         logger.info(f"Downloading dataset '{dataset}' into {dest.resolve()} (this may take a while)...")
-        api.dataset_download_files(dataset, path=str(dest), unzip=True, quiet=False)
-        logger.info("Download complete and files extracted.")
+        api.dataset_download_files(dataset, path=str(dest), unzip=False, quiet=False)
 
-        # Count files
-        files = [p for p in dest.rglob('*') if p.is_file()]
-        logger.info(f"Files downloaded/extracted: {len(files)}")
+        # Extract ourselves so the file count comes from the archive listing
+        # rather than a recursive walk over the extracted tree
+        zip_path = dest / f"{dataset.split('/')[-1]}.zip"
+        file_count = extract_zip(zip_path, dest, workers)
+        zip_path.unlink()
+        logger.info("Download complete and files extracted.")
+        logger.info(f"Files downloaded/extracted: {file_count}")
         return True
 
     except Exception as e:
@@ -82,6 +127,7 @@ def main():
     parser.add_argument('--dataset', '-d', default='plantvillage/plantvillage',
                         help='Kaggle dataset slug (owner/dataset-name). Default: plantvillage/plantvillage')
     parser.add_argument('--dest', default='data/kaggle', help='Destination folder (default: data/kaggle)')
+    parser.add_argument('--workers', type=int, default=4, help='Threads used to extract the archive (default: 4)')
     args = parser.parse_args()
 
     dataset = args.dataset
@@ -89,7 +135,7 @@ def main():
 
     logger.info(f"Requested dataset: {dataset}")
 
-    ok = download_dataset(dataset, dest)
+    ok = download_dataset(dataset, dest, args.workers)
     if not ok:
         logger.error("Dataset download failed. Follow the printed instructions to configure Kaggle and try again.")
         sys.exit(1)
@@ -12,11 +12,12 @@ Date: 2024
 import os
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # plots are saved to files, no GUI backend needed
 import matplotlib.pyplot as plt
 import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
 from tensorflow.keras.applications import MobileNetV2
 from tensorflow.keras.optimizers import Adam
 from sklearn.model_selection import train_test_split
@@ -30,54 +31,107 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class HeadValidation(keras.callbacks.Callback):
+    """
+    Validate the classification head on cached backbone features
+    """
+    
+    def __init__(self, head_model, feature_ds):
+        super().__init__()
+        self.head_model = head_model
+        self.feature_ds = feature_ds
+    
+    def on_epoch_end(self, epoch, logs=None):
+        # Fills in val_loss/val_accuracy for the callbacks and History that follow
+        if logs is None:
+            return
+        val_loss, val_accuracy = self.head_model.evaluate(self.feature_ds, verbose=0)
+        logs['val_loss'] = val_loss
+        logs['val_accuracy'] = val_accuracy
+
 class CropHealthModelTrainer:
     """
     CNN Model Trainer for Crop Health Detection
     """
     
-    def __init__(self, img_size=(224, 224), batch_size=32, epochs=50):
+    def __init__(self, img_size=(224, 224), batch_size=32, epochs=50, seed=42):
         self.img_size = img_size
         self.batch_size = batch_size
         self.epochs = epochs
         self.model = None
+        # Frozen backbone and trainable head that make up self.model
+        self.base_model = None
+        self.head_model = None
         self.history = None
+        # Validation split from the last train_model run
+        self.X_val = None
+        self.y_val = None
         self.class_names = ['Healthy', 'Diseased', 'Pest-affected']
+        # Seeded Generator for synthetic data instead of the global np.random state
+        self.rng = np.random.default_rng(seed)
         
-    def create_model(self):
+    def create_model(self, learning_rate=0.001):
         """
         Create CNN model architecture for crop health detection
         """
         logger.info("Creating CNN model architecture...")
         
-        # Use MobileNetV2 as base model for transfer learning
-        base_model = MobileNetV2(
-            input_shape=(*self.img_size, 3),
-            include_top=False,
-            weights='imagenet'
-        )
+        # Mixed precision only pays off on GPUs with FP16 tensor cores; on CPU
+        # float16 math is emulated and slower, so keep float32 there
+        use_mixed_precision = bool(tf.config.list_physical_devices('GPU'))
+        if use_mixed_precision:
+            keras.mixed_precision.set_global_policy('mixed_float16')
+            logger.info("Using mixed_float16 precision policy")
+        
+        # Use MobileNetV2 as base model for transfer learning. The model takes
+        # raw [0, 255] pixels; Rescaling maps them to MobileNetV2's [-1, 1]
+        # (same as mobilenet_v2.preprocess_input) on the device
+        base_model = keras.Sequential([
+            keras.Input(shape=(*self.img_size, 3)),
+            layers.Rescaling(1.0 / 127.5, offset=-1.0),
+            MobileNetV2(
+                input_shape=(*self.img_size, 3),
+                include_top=False,
+                weights='imagenet'
+            )
+        ])
         
         # Freeze base model layers
         base_model.trainable = False
         
-        # Add custom classification head
-        model = keras.Sequential([
-            base_model,
-            layers.GlobalAveragePooling2D(),
+        # Add custom classification head, kept as its own model so it can
+        # also run on precomputed backbone features
+        head_model = keras.Sequential([
+            layers.GlobalAveragePooling2D(input_shape=base_model.output_shape[1:]),
             layers.Dropout(0.2),
             layers.Dense(128, activation='relu'),
             layers.Dropout(0.3),
             layers.Dense(64, activation='relu'),
             layers.Dropout(0.2),
-            layers.Dense(len(self.class_names), activation='softmax')
+            # Softmax stays float32 for numerically stable probabilities
+            layers.Dense(len(self.class_names), activation='softmax', dtype='float32')
         ])
+        model = keras.Sequential([base_model, head_model])
+        
+        optimizer = Adam(learning_rate=learning_rate)
+        if use_mixed_precision:
+            optimizer = keras.mixed_precision.LossScaleOptimizer(optimizer)
         
         # Compile model
         model.compile(
-            optimizer=Adam(learning_rate=0.001),
+            optimizer=optimizer,
             loss='categorical_crossentropy',
-            metrics=['accuracy']
+            metrics=['accuracy'],
+            # XLA fuses the depthwise conv/BN/ReLU blocks; training batches
+            # have a fixed shape (drop_remainder) so it compiles once
+            jit_compile=True
         )
+        # The head only evaluates on cached features; it shares its weights
+        # with the full model
+        head_model.compile(loss='categorical_crossentropy', metrics=['accuracy'])
         
+        self.base_model = base_model
+        self.head_model = head_model
         self.model = model
         logger.info(f"Model created with {model.count_params()} parameters")
         return model
@@ -89,41 +143,43 @@ class CropHealthModelTrainer:
         """
         logger.info("Generating synthetic crop health data...")
         
-        # Create synthetic images with different characteristics
-        images = []
-        labels = []
-        
-        for i in range(num_samples):
-            # Generate random image
-            img = np.random.randint(0, 255, (*self.img_size, 3), dtype=np.uint8)
-            
-            # Add different patterns based on health status
-            label_idx = i % len(self.class_names)
-            
-            if label_idx == 0:  # Healthy - green dominant
-                img[:, :, 1] = np.clip(img[:, :, 1] + 50, 0, 255)
-            elif label_idx == 1:  # Diseased - brown/yellow spots
-                # Add brown spots
-                spots = np.random.randint(0, 50, (10, 10, 3))
-                spots[:, :, 0] = 139  # Brown
-                spots[:, :, 1] = 69
-                spots[:, :, 2] = 19
-                x, y = np.random.randint(0, self.img_size[0]-10), np.random.randint(0, self.img_size[1]-10)
-                img[x:x+10, y:y+10] = spots
-            else:  # Pest-affected - irregular patterns
-                # Add irregular patterns
-                noise = np.random.randint(-30, 30, (*self.img_size, 3))
-                img = np.clip(img + noise, 0, 255)
-            
-            images.append(img)
-            labels.append(label_idx)
-        
-        return np.array(images), np.array(labels)
+        # Create all synthetic images in one allocation; samples cycle through the
+        # classes, so every class is a strided view (images[k::n_classes])
+        n_classes = len(self.class_names)
+        h, w = self.img_size
+        images = self.rng.integers(0, 255, (num_samples, h, w, 3), dtype=np.uint8)
+        labels = np.arange(num_samples) % n_classes
+        
+        # Healthy - green dominant (saturating +50 on the green channel)
+        green = images[0::n_classes, :, :, 1]
+        np.minimum(green, 255 - 50, out=green)
+        green += 50
+        
+        # Diseased - a 10x10 brown spot at a random position
+        diseased = images[1::n_classes]
+        n_diseased = len(diseased)
+        offsets = np.arange(10)
+        rows = self.rng.integers(0, h - 10, n_diseased)[:, None] + offsets
+        cols = self.rng.integers(0, w - 10, n_diseased)[:, None] + offsets
+        diseased[np.arange(n_diseased)[:, None, None], rows[:, :, None], cols[:, None, :]] = (139, 69, 19)
+        
+        # Pest-affected - irregular patterns from additive noise, in chunks to
+        # bound the int16 scratch memory
+        pest = images[2::n_classes]
+        for start in range(0, len(pest), 64):
+            chunk = pest[start:start + 64]
+            noisy = chunk.astype(np.int16)
+            noisy += self.rng.integers(-30, 30, chunk.shape, dtype=np.int16)
+            np.clip(noisy, 0, 255, out=noisy)
+            chunk[...] = noisy
+        
+        return images, labels
     
-    def prepare_data(self):
+    def prepare_data(self, batch_size=None):
         """
-        Prepare training and validation data
+        Prepare training data and cached validation features (needs create_model first)
         """
+        batch_size = batch_size or self.batch_size
         logger.info("Preparing training data...")
         
         # Generate synthetic data
@@ -137,22 +193,39 @@ class CropHealthModelTrainer:
             X, y_categorical, test_size=0.2, random_state=42, stratify=y
         )
         
-        # Data augmentation
-        train_datagen = ImageDataGenerator(
-            rotation_range=20,
-            width_shift_range=0.2,
-            height_shift_range=0.2,
-            horizontal_flip=True,
-            zoom_range=0.2,
-            brightness_range=[0.8, 1.2]
-        )
+        # Data augmentation runs batched inside the tf.data pipeline
+        augment = keras.Sequential([
+            layers.RandomFlip('horizontal'),
+            layers.RandomRotation(20 / 360),
+            layers.RandomTranslation(0.2, 0.2),
+            layers.RandomZoom(0.2),
+        ])
         
-        val_datagen = ImageDataGenerator()
+        def augment_batch(x, y):
+            x = augment(tf.cast(x, tf.float32), training=True)
+            # Multiplicative brightness in [0.8, 1.2] per image
+            x = x * tf.random.uniform((tf.shape(x)[0], 1, 1, 1), 0.8, 1.2)
+            # Back to uint8 so batches reach the model at a quarter of the size
+            return tf.cast(tf.round(tf.clip_by_value(x, 0.0, 255.0)), tf.uint8), y
+        
+        train_ds = (
+            tf.data.Dataset.from_tensor_slices((X_train, y_train))
+            .shuffle(2048)
+            .batch(batch_size, drop_remainder=True)
+            .map(augment_batch, num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE)
+        )
         
-        train_generator = train_datagen.flow(X_train, y_train, batch_size=self.batch_size)
-        val_generator = val_datagen.flow(X_val, y_val, batch_size=self.batch_size)
+        # Validation is not augmented and the backbone is frozen, so its
+        # backbone features are identical every epoch: compute them once
+        val_features = self.base_model.predict(X_val, batch_size=64)
+        val_ds = (
+            tf.data.Dataset.from_tensor_slices((val_features, y_val))
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
         
-        return train_generator, val_generator, X_val, y_val
+        return train_ds, val_ds, X_val, y_val
     
     def train_model(self):
         """
@@ -160,14 +233,23 @@ class CropHealthModelTrainer:
         """
         logger.info("Starting model training...")
         
+        # Replicate across all local GPUs (a single device falls back to one
+        # replica). batch_size is per replica; the learning rate scales with
+        # the global batch.
+        strategy = tf.distribute.MirroredStrategy()
+        replicas = strategy.num_replicas_in_sync
+        logger.info(f"Training on {replicas} replica(s)")
+        
         # Create model
-        self.create_model()
+        with strategy.scope():
+            self.create_model(learning_rate=0.001 * replicas)
         
         # Prepare data
-        train_gen, val_gen, X_val, y_val = self.prepare_data()
+        train_ds, val_ds, self.X_val, self.y_val = self.prepare_data(self.batch_size * replicas)
         
-        # Callbacks
+        # Callbacks; HeadValidation goes first so the others see its metrics
         callbacks = [
+            HeadValidation(self.head_model, val_ds),
             keras.callbacks.EarlyStopping(
                 monitor='val_accuracy',
                 patience=10,
@@ -189,9 +271,8 @@ class CropHealthModelTrainer:
         
         # Train model
         self.history = self.model.fit(
-            train_gen,
+            train_ds,
             epochs=self.epochs,
-            validation_data=val_gen,
             callbacks=callbacks,
             verbose=1
         )
@@ -206,7 +287,9 @@ class CropHealthModelTrainer:
         logger.info("Evaluating model performance...")
         
         # Predictions
-        predictions = self.model.predict(X_val)
+        # The model rescales the uint8 pixels itself; one predict call with
+        # large batches keeps the device busy between Python round-trips
+        predictions = self.model.predict(X_val, batch_size=256, verbose=0)
         y_pred = np.argmax(predictions, axis=1)
         y_true = np.argmax(y_val, axis=1)
         
@@ -248,7 +331,7 @@ class CropHealthModelTrainer:
         
         plt.tight_layout()
         plt.savefig('model/training_history.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        plt.close(fig)
     
     def save_model_info(self):
         """
@@ -288,11 +371,8 @@ def main():
         # Train model
         history = trainer.train_model()
         
-        # Prepare validation data for evaluation
-        _, _, X_val, y_val = trainer.prepare_data()
-        
-        # Evaluate model
-        report, cm = trainer.evaluate_model(X_val, y_val)
+        # Evaluate model on the validation split used during training
+        report, cm = trainer.evaluate_model(trainer.X_val, trainer.y_val)
         
         # Plot training history
         trainer.plot_training_history()
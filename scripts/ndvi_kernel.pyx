@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Smart Farming Drones - Single-pass NDVI kernel
+==============================================
+
+Computes NDVI, category labels, the category histogram and NDVI statistics in
+one sweep over the NIR/Red bands. Compiled on first import through pyximport
+(see ndvi_kernel.pyxbld); image_processing falls back to NumPy/Numba without it.
+"""
+
+import numpy as np
+from cython.parallel import prange
+from libc.math cimport sqrt, INFINITY
+from libc.stdint cimport uint8_t, uint16_t, int8_t
+
+ctypedef fused band_t:
+    uint8_t
+    uint16_t
+    float
+
+
+def ndvi_all(const band_t[:, ::1] nir, const band_t[:, ::1] red,
+             float[:, ::1] ndvi_out, int8_t[:, ::1] cls_out, const float[::1] bins):
+    """
+    Fill ndvi_out/cls_out and return (counts, mean, std, min, max)
+
+    cls_out matches np.digitize(ndvi, bins); counts has len(bins) + 1 entries.
+    """
+    cdef Py_ssize_t h = nir.shape[0], w = nir.shape[1], nb = bins.shape[0]
+    cdef Py_ssize_t i, j, k, c
+    cdef float n, r, d, v
+    # Per-row partials so rows can run on separate threads:
+    # counts[0..nb], sum, sum of squares, min, max
+    partial_arr = np.zeros((h, nb + 5), dtype=np.float64)
+    cdef double[:, ::1] partial = partial_arr
+
+    for i in prange(h, nogil=True, schedule='static'):
+        partial[i, nb + 3] = INFINITY
+        partial[i, nb + 4] = -INFINITY
+        for j in range(w):
+            n = <float>nir[i, j]
+            r = <float>red[i, j]
+            d = n + r
+            if d < 1e-10:
+                d = 1e-10
+            v = (n - r) / d
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            ndvi_out[i, j] = v
+
+            c = 0
+            for k in range(nb):
+                if v >= bins[k]:
+                    c = k + 1
+            cls_out[i, j] = <int8_t>c
+
+            partial[i, c] += 1
+            partial[i, nb + 1] += v
+            partial[i, nb + 2] += v * v
+            if v < partial[i, nb + 3]:
+                partial[i, nb + 3] = v
+            if v > partial[i, nb + 4]:
+                partial[i, nb + 4] = v
+
+    size = h * w
+    totals = partial_arr.sum(axis=0)
+    mean = totals[nb + 1] / size
+    var = max(totals[nb + 2] / size - mean * mean, 0.0)
+    counts = totals[:nb + 1].astype(np.int64)
+    return counts, mean, sqrt(var), partial_arr[:, nb + 3].min(), partial_arr[:, nb + 4].max()
@@ -14,22 +14,46 @@ import numpy as np
 import pandas as pd
 import cv2
 import json
-import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from PIL import Image, ImageDraw
-import matplotlib.pyplot as plt
+import matplotlib
 import logging
 
+# Figures are only written to files, so use the non-interactive Agg backend;
+# pyplot itself is imported lazily by the methods that plot
+matplotlib.use('Agg')
+
+# PyTurboJPEG is optional; it encodes RGB arrays directly with libjpeg-turbo's SIMD path
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbojpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except Exception:
+    TURBOJPEG_AVAILABLE = False
+
+# PyArrow is optional; tables are written as Parquet with it and as CSV without
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _run_generator(generator, seed, method: str, *args):
+    """Run one generate_* method in a worker with its own random stream"""
+    generator.rng = np.random.default_rng(seed)
+    getattr(generator, method)(*args)
+
 class SampleDataGenerator:
     """
     Generate sample data for Smart Farming Drones project
     """
     
-    def __init__(self):
+    def __init__(self, seed: int = 42):
         self.data_dir = "data"
         self.sample_images_dir = os.path.join(self.data_dir, "sample_images")
         self.mock_data_dir = os.path.join(self.data_dir, "mock_data")
@@ -38,6 +62,9 @@ class SampleDataGenerator:
         os.makedirs(self.sample_images_dir, exist_ok=True)
         os.makedirs(self.mock_data_dir, exist_ok=True)
         
+        # One seeded Generator for all draws instead of the global np.random/random state
+        self.rng = np.random.default_rng(seed)
+        
         logger.info("Sample Data Generator initialized")
     
     def generate_crop_images(self, num_images: int = 20):
@@ -50,61 +77,81 @@ class SampleDataGenerator:
         crop_types = ['Wheat', 'Rice', 'Corn', 'Soybean', 'Cotton']
         health_conditions = ['Healthy', 'Diseased', 'Pest-affected']
         
-        for i in range(num_images):
-            # Create base image
-            img = np.random.randint(50, 200, (*image_size, 3), dtype=np.uint8)
-            
-            # Select random crop type and health condition
-            crop_type = random.choice(crop_types)
-            health_condition = random.choice(health_conditions)
-            
-            # Modify image based on health condition
-            if health_condition == 'Healthy':
-                # Make it more green (healthy)
-                img[:, :, 1] = np.clip(img[:, :, 1] + 60, 0, 255)
-                img[:, :, 0] = np.clip(img[:, :, 0] - 20, 0, 255)
-                img[:, :, 2] = np.clip(img[:, :, 2] - 20, 0, 255)
-                
-                # Add some texture
-                for _ in range(5):
-                    x, y = random.randint(0, image_size[0]-20), random.randint(0, image_size[1]-20)
-                    img[x:x+20, y:y+20] = np.clip(img[x:x+20, y:y+20] + 30, 0, 255)
-            
-            elif health_condition == 'Diseased':
-                # Add brown/yellow spots (disease)
-                img[:, :, 1] = np.clip(img[:, :, 1] + 30, 0, 255)
-                img[:, :, 0] = np.clip(img[:, :, 0] + 40, 0, 255)
-                
-                # Add disease spots
-                for _ in range(8):
-                    x, y = random.randint(0, image_size[0]-15), random.randint(0, image_size[1]-15)
-                    spot_color = [139, 69, 19]  # Brown
-                    img[x:x+15, y:y+15] = spot_color
-            
-            else:  # Pest-affected
-                # Add irregular patterns (pest damage)
-                img[:, :, 1] = np.clip(img[:, :, 1] + 20, 0, 255)
-                
-                # Add irregular holes/patterns
-                for _ in range(6):
-                    x, y = random.randint(0, image_size[0]-25), random.randint(0, image_size[1]-25)
-                    mask = np.random.random((25, 25)) > 0.7
-                    img[x:x+25, y:y+25][mask] = [50, 50, 50]  # Dark spots
-            
-            # Add some noise for realism
-            noise = np.random.normal(0, 10, img.shape)
-            img = np.clip(img + noise, 0, 255).astype(np.uint8)
-            
+        # Create all base images at once; edits run in int16 and are clipped once
+        # at the end, which saturates like the per-step clips
+        images = self.rng.integers(50, 200, (num_images, *image_size, 3), dtype=np.int16)
+        
+        # Select random crop type and health condition
+        crops = self.rng.choice(crop_types, num_images)
+        conditions = self.rng.choice(health_conditions, num_images)
+        
+        def spot_index(idx, num_spots, size):
+            # Broadcastable (image, row, col) indices for num_spots square spots
+            # of the given size per image, at random positions
+            offsets = np.arange(size)
+            xs = self.rng.integers(0, image_size[0] - size + 1, (len(idx), num_spots))
+            ys = self.rng.integers(0, image_size[1] - size + 1, (len(idx), num_spots))
+            return (idx[:, None, None, None],
+                    (xs[:, :, None] + offsets)[..., None],
+                    (ys[:, :, None] + offsets)[:, :, None, :])
+        
+        # Healthy - more green, plus some texture (overlapping patches add up)
+        healthy = np.flatnonzero(conditions == 'Healthy')
+        images[healthy] += np.array([-20, 60, -20], dtype=np.int16)
+        np.add.at(images, spot_index(healthy, 5, 20), 30)
+        
+        # Diseased - brown/yellow tint with brown disease spots
+        diseased = np.flatnonzero(conditions == 'Diseased')
+        images[diseased] += np.array([40, 30, 0], dtype=np.int16)
+        images[spot_index(diseased, 8, 15)] = [139, 69, 19]  # Brown
+        
+        # Pest-affected - irregular holes/patterns as dark spots
+        pest = np.flatnonzero(conditions == 'Pest-affected')
+        images[pest, :, :, 1] += 20
+        n, r, c = np.broadcast_arrays(*spot_index(pest, 6, 25))
+        mask = self.rng.random(n.shape) > 0.7
+        images[n[mask], r[mask], c[mask]] = [50, 50, 50]  # Dark spots
+        
+        # Add some noise for realism, accumulating and clipping in one float32 buffer
+        noisy = self.rng.standard_normal(images.shape, dtype=np.float32)
+        noisy *= 10
+        noisy += images
+        np.clip(noisy, 0, 255, out=noisy)
+        images = noisy.astype(np.uint8)
+        
+        for i, (img, crop_type, health_condition) in enumerate(zip(images, crops, conditions)):
             # Save image
             filename = f"{crop_type.lower()}_{health_condition.lower()}_{i:02d}.jpg"
             filepath = os.path.join(self.sample_images_dir, filename)
-            
-            # Convert RGB to BGR for OpenCV
-            img_bgr = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
-            cv2.imwrite(filepath, img_bgr)
+            self._write_jpeg(filepath, img)
         
         logger.info(f"Generated {num_images} crop images in {self.sample_images_dir}")
     
+    def _write_jpeg(self, filepath: str, img_rgb: np.ndarray, quality: int = 95):
+        """
+        Write an RGB uint8 image as JPEG
+        """
+        if TURBOJPEG_AVAILABLE:
+            # TurboJPEG takes RGB as-is, so no channel-swapped copy is needed
+            with open(filepath, 'wb') as f:
+                f.write(_turbojpeg.encode(img_rgb, quality=quality, pixel_format=TJPF_RGB))
+        else:
+            # Convert RGB to BGR for OpenCV
+            cv2.imwrite(filepath, cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR),
+                        [cv2.IMWRITE_JPEG_QUALITY, quality])
+    
+    def _save_table(self, df: pd.DataFrame, name: str) -> str:
+        """
+        Save a table in the mock data directory and return its path
+        """
+        if PYARROW_AVAILABLE:
+            path = os.path.join(self.mock_data_dir, f"{name}.parquet")
+            df.to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+        else:
+            path = os.path.join(self.mock_data_dir, f"{name}.csv")
+            df.to_csv(path, index=False)
+        return path
+    
     def generate_ndvi_data(self, width: int = 100, height: int = 100):
         """
         Generate mock NDVI data with realistic patterns
@@ -112,8 +159,8 @@ class SampleDataGenerator:
         logger.info("Generating mock NDVI data...")
         
         # Create coordinate grids
-        x = np.linspace(0, 10, width)
-        y = np.linspace(0, 10, height)
+        x = np.linspace(0, 10, width, dtype=np.float32)
+        y = np.linspace(0, 10, height, dtype=np.float32)
         X, Y = np.meshgrid(x, y)
         
         # Create realistic vegetation patterns
@@ -125,38 +172,47 @@ class SampleDataGenerator:
         )
         
         # Add some variation
-        variation = np.random.normal(0, 0.1, (height, width))
+        variation = self.rng.standard_normal((height, width), dtype=np.float32)
+        variation *= 0.1
         vegetation_pattern += variation
         
         # Generate NIR and Red bands
         # NIR is typically higher for vegetation
-        nir_band = np.clip(vegetation_pattern * 255, 0, 255).astype(np.uint8)
+        nir = vegetation_pattern * 255
+        np.clip(nir, 0, 255, out=nir)
+        nir_band = nir.astype(np.uint8)
         
         # Red band is typically lower for vegetation
-        red_band = np.clip((1 - vegetation_pattern * 0.7) * 255, 0, 255).astype(np.uint8)
-        
-        # Calculate NDVI
-        ndvi = (nir_band.astype(np.float32) - red_band.astype(np.float32)) / \
-               (nir_band.astype(np.float32) + red_band.astype(np.float32) + 1e-10)
-        ndvi = np.clip(ndvi, -1.0, 1.0)
-        
-        # Save NDVI data
-        ndvi_data = {
-            'nir_band': nir_band.tolist(),
-            'red_band': red_band.tolist(),
-            'ndvi': ndvi.tolist(),
-            'metadata': {
-                'width': width,
-                'height': height,
-                'generated_at': datetime.now().isoformat(),
-                'description': 'Mock NDVI data for Smart Farming Drones'
-            }
+        red = vegetation_pattern * 0.7
+        np.subtract(1, red, out=red)
+        red *= 255
+        np.clip(red, 0, 255, out=red)
+        red_band = red.astype(np.uint8)
+        
+        # Calculate NDVI with one float32 copy of each band, updated in place
+        ndvi = nir_band.astype(np.float32)
+        red_f = red_band.astype(np.float32)
+        denom = ndvi + red_f
+        denom += 1e-10
+        ndvi -= red_f
+        ndvi /= denom
+        np.clip(ndvi, -1.0, 1.0, out=ndvi)
+        
+        # Save NDVI bands as binary arrays, with the metadata in a JSON sidecar
+        np.savez_compressed(os.path.join(self.mock_data_dir, 'ndvi_data.npz'),
+                            nir_band=nir_band, red_band=red_band, ndvi=ndvi)
+        ndvi_metadata = {
+            'width': width,
+            'height': height,
+            'generated_at': datetime.now().isoformat(),
+            'description': 'Mock NDVI data for Smart Farming Drones'
         }
         
-        with open(os.path.join(self.mock_data_dir, 'ndvi_data.json'), 'w') as f:
-            json.dump(ndvi_data, f, indent=2)
+        with open(os.path.join(self.mock_data_dir, 'ndvi_metadata.json'), 'w') as f:
+            json.dump(ndvi_metadata, f, indent=2)
         
         # Create NDVI visualization
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 4))
         
         plt.subplot(1, 3, 1)
@@ -176,7 +232,7 @@ class SampleDataGenerator:
         
         plt.tight_layout()
         plt.savefig(os.path.join(self.mock_data_dir, 'ndvi_visualization.png'), 
-                   dpi=300, bbox_inches='tight')
+                   dpi=100, bbox_inches='tight')
         plt.close()
         
         logger.info("NDVI data generated and saved")
@@ -187,42 +243,39 @@ class SampleDataGenerator:
         """
         logger.info(f"Generating {num_readings} sensor readings...")
         
-        # Generate time series
+        # Generate time series (hourly readings), one vector per sensor
         start_time = datetime.now() - timedelta(days=7)
-        timestamps = [start_time + timedelta(hours=i) for i in range(num_readings)]
+        i = np.arange(num_readings)
+        timestamps = np.datetime64(start_time, 'us') + i.astype('timedelta64[h]')
         
-        sensor_data = []
+        # Simulate realistic sensor readings
+        temperature = 25 + 10 * np.sin(i * 0.1) + self.rng.normal(0, 2, num_readings)
+        humidity = 60 + 20 * np.sin(i * 0.05) + self.rng.normal(0, 5, num_readings)
+        soil_moisture = 50 + 30 * np.sin(i * 0.03) + self.rng.normal(0, 8, num_readings)
+        ph_level = 6.5 + 0.5 * np.sin(i * 0.02) + self.rng.normal(0, 0.3, num_readings)
+        light_intensity = 500 + 300 * np.sin(i * 0.08) + self.rng.normal(0, 50, num_readings)
         
-        for i, timestamp in enumerate(timestamps):
-            # Simulate realistic sensor readings
-            temperature = 25 + 10 * np.sin(i * 0.1) + np.random.normal(0, 2)
-            humidity = 60 + 20 * np.sin(i * 0.05) + np.random.normal(0, 5)
-            soil_moisture = 50 + 30 * np.sin(i * 0.03) + np.random.normal(0, 8)
-            ph_level = 6.5 + 0.5 * np.sin(i * 0.02) + np.random.normal(0, 0.3)
-            light_intensity = 500 + 300 * np.sin(i * 0.08) + np.random.normal(0, 50)
-            
-            # Add some correlation between sensors
-            if soil_moisture < 30:
-                temperature += 2  # Higher temp when soil is dry
-                humidity -= 5    # Lower humidity when soil is dry
-            
-            reading = {
-                'timestamp': timestamp.isoformat(),
-                'temperature_c': round(temperature, 2),
-                'humidity_percent': round(humidity, 2),
-                'soil_moisture_percent': round(soil_moisture, 2),
-                'ph_level': round(ph_level, 2),
-                'light_intensity_lux': round(light_intensity, 2),
-                'location': f"Zone_{i%25:02d}"  # 25 different zones
-            }
-            
-            sensor_data.append(reading)
+        # Add some correlation between sensors
+        dry = soil_moisture < 30
+        temperature[dry] += 2  # Higher temp when soil is dry
+        humidity[dry] -= 5     # Lower humidity when soil is dry
+        
+        zone_names = np.array([f"Zone_{z:02d}" for z in range(25)])  # 25 different zones
         
         # Save sensor data
-        sensor_df = pd.DataFrame(sensor_data)
-        sensor_df.to_csv(os.path.join(self.mock_data_dir, 'sensor_data.csv'), index=False)
+        sensor_df = pd.DataFrame({
+            'timestamp': np.datetime_as_string(timestamps, unit='us'),
+            'temperature_c': np.round(temperature, 2),
+            'humidity_percent': np.round(humidity, 2),
+            'soil_moisture_percent': np.round(soil_moisture, 2),
+            'ph_level': np.round(ph_level, 2),
+            'light_intensity_lux': np.round(light_intensity, 2),
+            'location': zone_names[i % 25]
+        })
+        self._save_table(sensor_df, 'sensor_data')
         
         # Create sensor data visualization
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(15, 10))
         
         plt.subplot(2, 3, 1)
@@ -258,7 +311,7 @@ class SampleDataGenerator:
         
         plt.tight_layout()
         plt.savefig(os.path.join(self.mock_data_dir, 'sensor_data_visualization.png'), 
-                   dpi=300, bbox_inches='tight')
+                   dpi=100, bbox_inches='tight')
         plt.close()
         
         logger.info("Sensor data generated and saved")
@@ -280,10 +333,10 @@ class SampleDataGenerator:
             seasonal_rain = 5 + 10 * np.sin(2 * np.pi * (day_of_year - 100) / 365)
             
             # Daily weather
-            daily_temp = seasonal_temp + np.random.normal(0, 3)
-            daily_rainfall = max(0, seasonal_rain + np.random.normal(0, 2))
-            daily_humidity = 60 + 20 * np.sin(day * 0.1) + np.random.normal(0, 5)
-            wind_speed = 5 + 3 * np.random.random()
+            daily_temp = seasonal_temp + self.rng.normal(0, 3)
+            daily_rainfall = max(0, seasonal_rain + self.rng.normal(0, 2))
+            daily_humidity = 60 + 20 * np.sin(day * 0.1) + self.rng.normal(0, 5)
+            wind_speed = 5 + 3 * self.rng.random()
             
             weather_entry = {
                 'date': date.strftime('%Y-%m-%d'),
@@ -293,14 +346,14 @@ class SampleDataGenerator:
                 'rainfall_mm': round(daily_rainfall, 1),
                 'humidity_percent': round(daily_humidity, 1),
                 'wind_speed_kmh': round(wind_speed, 1),
-                'sunshine_hours': round(8 + 4 * np.random.random(), 1)
+                'sunshine_hours': round(8 + 4 * self.rng.random(), 1)
             }
             
             weather_data.append(weather_entry)
         
         # Save weather data
         weather_df = pd.DataFrame(weather_data)
-        weather_df.to_csv(os.path.join(self.mock_data_dir, 'weather_data.csv'), index=False)
+        self._save_table(weather_df, 'weather_data')
         
         logger.info("Weather data generated and saved")
     
@@ -319,8 +372,8 @@ class SampleDataGenerator:
             zone_id = f"Zone_{i:02d}"
             
             # Generate zone coordinates (assuming 500x500 meter field)
-            x = random.uniform(0, 500)
-            y = random.uniform(0, 500)
+            x = self.rng.uniform(0, 500)
+            y = self.rng.uniform(0, 500)
             
             zone_data = {
                 'zone_id': zone_id,
@@ -328,49 +381,60 @@ class SampleDataGenerator:
                 'center_y': round(y, 2),
                 'width': 100.0,
                 'height': 100.0,
-                'crop_type': random.choice(crop_types),
-                'health_status': random.choice(health_statuses),
-                'ndvi_value': round(random.uniform(0.2, 0.8), 3),
-                'moisture_level': round(random.uniform(30, 80), 1),
-                'soil_ph': round(random.uniform(5.5, 7.5), 2),
-                'nutrient_nitrogen': round(random.uniform(20, 80), 1),
-                'nutrient_phosphorus': round(random.uniform(15, 60), 1),
-                'nutrient_potassium': round(random.uniform(25, 70), 1),
+                'crop_type': str(self.rng.choice(crop_types)),
+                'health_status': str(self.rng.choice(health_statuses)),
+                'ndvi_value': round(self.rng.uniform(0.2, 0.8), 3),
+                'moisture_level': round(self.rng.uniform(30, 80), 1),
+                'soil_ph': round(self.rng.uniform(5.5, 7.5), 2),
+                'nutrient_nitrogen': round(self.rng.uniform(20, 80), 1),
+                'nutrient_phosphorus': round(self.rng.uniform(15, 60), 1),
+                'nutrient_potassium': round(self.rng.uniform(25, 70), 1),
                 'last_sprayed': None,
-                'planting_date': (datetime.now() - timedelta(days=random.randint(30, 120))).strftime('%Y-%m-%d'),
-                'expected_harvest': (datetime.now() + timedelta(days=random.randint(30, 90))).strftime('%Y-%m-%d')
+                'planting_date': (datetime.now() - timedelta(days=int(self.rng.integers(30, 121)))).strftime('%Y-%m-%d'),
+                'expected_harvest': (datetime.now() + timedelta(days=int(self.rng.integers(30, 91)))).strftime('%Y-%m-%d')
             }
             
             zones_data.append(zone_data)
         
         # Save zones data
         zones_df = pd.DataFrame(zones_data)
-        zones_df.to_csv(os.path.join(self.mock_data_dir, 'field_zones.csv'), index=False)
+        self._save_table(zones_df, 'field_zones')
         
         logger.info("Field zones data generated and saved")
     
-    def generate_all_sample_data(self):
+    def generate_all_sample_data(self, max_workers: int = None):
         """
         Generate all sample data
         """
         logger.info("Generating all sample data...")
         
-        # Generate different types of sample data
-        self.generate_crop_images(30)
-        self.generate_ndvi_data(100, 100)
-        self.generate_sensor_data(500)
-        self.generate_weather_data(30)
-        self.generate_field_zones_data(25)
+        # Generate different types of sample data. The generators write disjoint
+        # files, so each runs in its own process; every task gets a seed drawn
+        # from self.rng so the workers don't replay the same random stream
+        tasks = [
+            ('generate_crop_images', 30),
+            ('generate_ndvi_data', 100, 100),
+            ('generate_sensor_data', 500),
+            ('generate_weather_data', 30),
+            ('generate_field_zones_data', 25),
+        ]
+        seeds = self.rng.integers(2**63, size=len(tasks))
+        with ProcessPoolExecutor(max_workers=max_workers or min(len(tasks), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(_run_generator, self, int(seed), *task)
+                       for seed, task in zip(seeds, tasks)]
+            for future in futures:
+                future.result()
         
         # Create a summary file
+        ext = 'parquet' if PYARROW_AVAILABLE else 'csv'
         summary = {
             'generated_at': datetime.now().isoformat(),
             'data_files': {
                 'crop_images': f"{len(os.listdir(self.sample_images_dir))} images in {self.sample_images_dir}",
-                'ndvi_data': f"NDVI data in {self.mock_data_dir}/ndvi_data.json",
-                'sensor_data': f"Sensor readings in {self.mock_data_dir}/sensor_data.csv",
-                'weather_data': f"Weather data in {self.mock_data_dir}/weather_data.csv",
-                'field_zones': f"Field zones in {self.mock_data_dir}/field_zones.csv"
+                'ndvi_data': f"NDVI data in {self.mock_data_dir}/ndvi_data.npz",
+                'sensor_data': f"Sensor readings in {self.mock_data_dir}/sensor_data.{ext}",
+                'weather_data': f"Weather data in {self.mock_data_dir}/weather_data.{ext}",
+                'field_zones': f"Field zones in {self.mock_data_dir}/field_zones.{ext}"
             },
             'description': 'Sample data for Smart Farming Drones AI project demonstration'
         }
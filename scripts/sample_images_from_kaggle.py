@@ -9,6 +9,9 @@ The script searches recursively for common image extensions and copies up to `co
 images into the destination folder.
 """
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import os
 import shutil
 import argparse
 import logging
@@ -19,16 +22,64 @@ logger = logging.getLogger(__name__)
 
 
 def collect_images(src: Path, exts=None):
+    """Lazily yield image files under src, so callers can stop walking early."""
     if exts is None:
         exts = {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'}
-    images = []
-    for p in src.rglob('*'):
-        if p.is_file() and p.suffix.lower() in exts:
-            images.append(p)
-    return images
-
-
-def copy_sample_images(src_root: str, dest_folder: str, count: int = 300):
+    # Depth-first os.scandir walk; DirEntry caches the type, saving a stat per file
+    stack = [str(src)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in exts and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable folder: {e}")
+
+
+def fast_copy(src: Path, dst: Path, same_fs: bool = False):
+    """Hardlink src to dst when possible, otherwise copy it in-kernel."""
+    # An earlier run may have left dst as a hardlink to src; opening it for
+    # writing would truncate the source, so skip it or replace the old file
+    try:
+        if os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    if same_fs:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Filesystem without hardlinks, cross-device link, etc.
+            pass
+    if hasattr(os, 'sendfile'):
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def _try_copy(src: Path, dst: Path, same_fs: bool) -> bool:
+    try:
+        fast_copy(src, dst, same_fs)
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to copy {src}: {e}")
+        return False
+
+
+def copy_sample_images(src_root: str, dest_folder: str, count: int = 300, workers: int = 8):
     src = Path(src_root)
     if not src.exists():
         logger.error(f"Source folder does not exist: {src}")
@@ -38,30 +89,34 @@ def copy_sample_images(src_root: str, dest_folder: str, count: int = 300):
     dest.mkdir(parents=True, exist_ok=True)
 
     images = collect_images(src)
-    if not images:
+    first = next(images, None)
+    if first is None:
         logger.error(f"No image files found under {src}")
         return 1
 
-    logger.info(f"Found {len(images)} images under {src}. Copying up to {count} images to {dest}...")
+    logger.info(f"Copying up to {count} images from {src} to {dest}...")
+    # Hardlinks only work within one filesystem
+    same_fs = os.stat(src).st_dev == os.stat(dest).st_dev
     copied = 0
     seen_names = set()
-    for img in images:
-        if copied >= count:
-            break
-        # avoid duplicate filenames
-        target_name = img.name
-        if target_name in seen_names:
-            # make unique by prefixing parent folder
-            target_name = f"{img.parent.name}_{img.name}"
-        seen_names.add(target_name)
-
-        target_path = dest / target_name
-        try:
-            shutil.copy2(img, target_path)
-            copied += 1
-        except Exception as e:
-            logger.warning(f"Failed to copy {img}: {e}")
-            continue
+    remaining = itertools.chain([first], images)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Copy in rounds so failed copies are replaced by the next images
+        while copied < count:
+            jobs = []
+            for img in remaining:
+                # avoid duplicate filenames
+                target_name = img.name
+                if target_name in seen_names:
+                    # make unique by prefixing parent folder
+                    target_name = f"{img.parent.name}_{img.name}"
+                seen_names.add(target_name)
+                jobs.append((img, dest / target_name))
+                if len(jobs) >= count - copied:
+                    break
+            if not jobs:
+                break
+            copied += sum(executor.map(lambda job: _try_copy(*job, same_fs), jobs))
 
     logger.info(f"Copied {copied} images to {dest}")
     return 0
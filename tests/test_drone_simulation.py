@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import numpy as np
+
+from scripts.drone_simulation import DroneSimulator
+
+
+def _run_with_timeout(fn, timeout=60):
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(stats=fn()), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), "mission did not finish"
+    return result['stats']
+
+
+def test_mission_over_empty_field_lands():
+    # A field smaller than one zone has no zones to visit
+    drone = DroneSimulator(40, 40, seed=1)
+    assert len(drone.field_zones) == 0
+
+    stats = _run_with_timeout(lambda: drone.autonomous_mission(60))
+
+    assert stats['zones_scanned'] == 0
+    assert stats['zones_sprayed'] == 0
+    assert not drone.is_flying
+
+
+def test_async_mission_over_empty_field_lands():
+    drone = DroneSimulator(40, 40, seed=1)
+
+    stats = _run_with_timeout(lambda: asyncio.run(drone.autonomous_mission_async(60)))
+
+    assert stats['zones_scanned'] == 0
+    assert not drone.is_flying
+
+
+def test_monte_carlo_fallback_keeps_global_random_state(monkeypatch):
+    # Run the plain-Python kernels even when numba is installed
+    from scripts import drone_simulation as ds
+    monkeypatch.setattr(ds, 'NUMBA_AVAILABLE', False)
+    for name in ('_run_one_mission', '_monte_carlo_runs'):
+        kernel = getattr(ds, name)
+        monkeypatch.setattr(ds, name, getattr(kernel, 'py_func', kernel))
+
+    np.random.seed(123)
+    expected = np.random.random(3)
+    np.random.seed(123)
+    DroneSimulator(200, 200, seed=1).monte_carlo(n_runs=2, mission_duration=30)
+
+    assert np.array_equal(np.random.random(3), expected)
+
+
+def test_monte_carlo_over_empty_field():
+    stats = DroneSimulator(40, 40, seed=1).monte_carlo(n_runs=3, mission_duration=30)
+
+    assert np.array_equal(stats['zones_scanned'], np.zeros(3))
+    assert np.array_equal(stats['zones_sprayed'], np.zeros(3))
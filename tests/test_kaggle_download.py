@@ -0,0 +1,34 @@
+import zipfile
+
+import pytest
+
+from scripts.kaggle_download import extract_zip
+
+
+@pytest.fixture
+def archive(tmp_path):
+    # Many small folders, files at the root, nested folders and an empty folder
+    path = tmp_path / 'dataset.zip'
+    with zipfile.ZipFile(path, 'w') as zf:
+        for d in range(300):
+            for f in range(3):
+                zf.writestr(f"color/class_{d}/img_{f}.jpg", f"{d}-{f}")
+        zf.writestr('README.txt', 'readme')
+        zf.writestr('nested/a/b/c.txt', 'deep')
+        zf.writestr('empty/', '')
+        zf.writestr('color/empty_class/', '')
+    return path
+
+
+@pytest.mark.parametrize('workers', [1, 4, 8])
+def test_extract_zip_matches_extractall(archive, tmp_path, workers):
+    for run in range(5):
+        dest = tmp_path / f"out_{workers}_{run}"
+        assert extract_zip(archive, dest, workers) == 300 * 3 + 2
+
+        assert (dest / 'color' / 'class_299' / 'img_2.jpg').read_text() == '299-2'
+        assert (dest / 'README.txt').read_text() == 'readme'
+        assert (dest / 'nested' / 'a' / 'b' / 'c.txt').read_text() == 'deep'
+        assert (dest / 'empty').is_dir()
+        assert (dest / 'color' / 'empty_class').is_dir()
+        assert sum(p.is_file() for p in dest.rglob('*')) == 300 * 3 + 2
@@ -0,0 +1,46 @@
+import os
+
+from scripts.sample_images_from_kaggle import copy_sample_images, fast_copy
+
+
+def _make_sources(root, count=4, size=1000):
+    root.mkdir()
+    for i in range(count):
+        (root / f"img_{i}.jpg").write_bytes(bytes([i]) * size)
+    return sorted(root.iterdir())
+
+
+def test_rerun_keeps_hardlinked_sources(tmp_path):
+    sources = _make_sources(tmp_path / 'src')
+    dest = tmp_path / 'dest'
+
+    for _ in range(2):
+        assert copy_sample_images(str(tmp_path / 'src'), str(dest), count=4) == 0
+
+    for i, src in enumerate(sources):
+        assert src.read_bytes() == bytes([i]) * 1000
+        assert (dest / src.name).read_bytes() == bytes([i]) * 1000
+
+
+def test_copy_over_hardlink_leaves_source_intact(tmp_path):
+    src, = _make_sources(tmp_path / 'src', count=1)
+    dst = tmp_path / 'dst.jpg'
+
+    fast_copy(src, dst, same_fs=True)
+    fast_copy(src, dst, same_fs=False)
+
+    assert src.read_bytes() == bytes([0]) * 1000
+    assert dst.read_bytes() == bytes([0]) * 1000
+
+
+def test_existing_unrelated_target_is_replaced(tmp_path):
+    src, = _make_sources(tmp_path / 'src', count=1)
+    other = tmp_path / 'other.jpg'
+    other.write_bytes(b'old')
+    dst = tmp_path / 'dst.jpg'
+    os.link(other, dst)
+
+    fast_copy(src, dst, same_fs=False)
+
+    assert dst.read_bytes() == bytes([0]) * 1000
+    assert other.read_bytes() == b'old'